@@ -11,6 +11,7 @@ import platform
 import signal
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 from typing import Dict, Any, Optional
@@ -28,6 +29,7 @@ from .checks import CheckRegistry, CheckResult as CheckResultInternal
 
 # Import check modules to register them
 from .checks.system import DiskUsageCheck, CpuUsageCheck, MemoryUsageCheck, SystemHealthCheck
+from .checks.system.sampler import SystemSampler
 from .checks.files import FilesystemIntegrityCheck
 from .checks.browser import CriticalFlowsCheck
 from .checks.logs import LogMonitorCheck
@@ -49,6 +51,8 @@ class HexaScanAgent:
     - Handle backoff and retries
     """
 
+    MAX_CONCURRENT_TASKS = 4  # Tasks from one poll run in parallel up to this limit
+
     def __init__(self, config_path: str = "/etc/hexascan-agent/agent.yaml"):
         """
         Initialize the agent with configuration.
@@ -61,6 +65,7 @@ class HexaScanAgent:
         self.api_client: Optional[ApiClient] = None
         self.running = False
         self._current_poll_interval = 60  # Default, will be updated from config
+        self._executor: Optional[ThreadPoolExecutor] = None
 
     def _setup_logging(self):
         """Configure logging based on configuration."""
@@ -128,8 +133,16 @@ class HexaScanAgent:
             api_key=self.config.api.api_key,
             timeout=self.config.api.timeout,
             verify_ssl=self.config.api.verify_ssl,
+            # Task threads submit results concurrently alongside the main loop
+            max_connections=self.MAX_CONCURRENT_TASKS + 1,
         )
 
+        # All check modules are imported by now; no more registrations
+        CheckRegistry.freeze()
+
+        # Prime CPU sampling so CPU checks do not block on their first run
+        SystemSampler.prime()
+
         self._current_poll_interval = self.config.api.poll_interval
         self.running = True
 
@@ -156,10 +169,7 @@ class HexaScanAgent:
                 tasks = self._poll_tasks()
 
                 # Execute tasks
-                for task in tasks:
-                    if not self.running:
-                        break
-                    self._execute_task(task)
+                self._execute_tasks(tasks)
 
                 # Wait for next poll
                 time.sleep(self._current_poll_interval)
@@ -187,6 +197,37 @@ class HexaScanAgent:
                 logger.error(f"Unexpected error in agent loop: {e}", exc_info=True)
                 time.sleep(60)
 
+    def _execute_tasks(self, tasks: list):
+        """
+        Execute polled tasks, running several at once when there are many.
+
+        Checks spend most of their time in syscalls and subprocesses, so a
+        thread pool turns the batch's wall time into roughly that of its
+        slowest tasks instead of the sum of all of them.
+
+        Args:
+            tasks: Tasks returned by the last poll
+        """
+        if len(tasks) <= 1:
+            for task in tasks:
+                self._execute_task(task)
+            return
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.MAX_CONCURRENT_TASKS,
+                thread_name_prefix='task',
+            )
+
+        futures = [self._executor.submit(self._run_task_if_running, task) for task in tasks]
+        for future in futures:
+            future.result()
+
+    def _run_task_if_running(self, task: Task):
+        """Execute a queued task unless the agent is shutting down."""
+        if self.running:
+            self._execute_task(task)
+
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals."""
         logger.info(f"Received signal {signum}, shutting down...")
@@ -195,6 +236,8 @@ class HexaScanAgent:
     def stop(self):
         """Stop the agent gracefully."""
         self.running = False
+        if self._executor:
+            self._executor.shutdown(wait=False)
         if self.api_client:
             self.api_client.close()
         logger.info("HexaScanAgent stopped")
@@ -4,8 +4,12 @@ Base check class for all monitoring checks.
 All check implementations should inherit from this base class.
 """
 
+import functools
+import json
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Optional, Tuple
 from enum import Enum
 
 
@@ -46,8 +50,99 @@ class CheckResult:
         }
 
 
+# (check class, serialized config) -> (monotonic expiry time, result)
+_result_cache: Dict[Tuple[str, str], Tuple[float, CheckResult]] = {}
+# Same key -> lock, so concurrent identical checks run once and share the result
+_result_locks: Dict[Tuple[str, str], threading.Lock] = {}
+# Guards adding and removing keys in both dicts
+_result_cache_lock = threading.Lock()
+
+
+def _prune_results(now: float):
+    """
+    Drop expired results, and the locks of keys with nothing cached.
+
+    Locks currently held are kept. Called with _result_cache_lock held.
+    """
+    for key in [key for key, (expires_at, _) in _result_cache.items() if expires_at <= now]:
+        del _result_cache[key]
+    for key in [
+        key for key, lock in _result_locks.items()
+        if key not in _result_cache and not lock.locked()
+    ]:
+        del _result_locks[key]
+
+
+def ttl_cached(execute: Callable[['BaseCheck'], CheckResult]) -> Callable[['BaseCheck'], CheckResult]:
+    """
+    Reuse a check's latest result while it is younger than its min_interval.
+
+    The cache key is the check class plus its full configuration, so only
+    identical checks share a result; identical checks running at the same
+    time wait for the first one instead of repeating its work. Checks
+    without a positive min_interval always execute, and error results are
+    never reused. Expired entries are dropped whenever a check executes, so
+    configs that stop being sent do not stay in memory.
+
+    Args:
+        execute: The check's execute method
+
+    Returns:
+        Wrapped execute method
+    """
+    @functools.wraps(execute)
+    def wrapper(self: 'BaseCheck') -> CheckResult:
+        min_interval = self.config.get('min_interval', self.DEFAULT_MIN_INTERVAL)
+        if not min_interval or min_interval <= 0:
+            return execute(self)
+
+        key = (
+            type(self).__qualname__,
+            json.dumps(self.config, sort_keys=True, default=str),
+        )
+        with _result_cache_lock:
+            key_lock = _result_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            now = time.monotonic()
+            cached = _result_cache.get(key)
+            if cached is not None and now < cached[0]:
+                return cached[1]
+
+            result = execute(self)
+            with _result_cache_lock:
+                if result.status != CheckStatus.ERROR:
+                    _result_cache[key] = (now + min_interval, result)
+                _prune_results(now)
+            return result
+
+    wrapper._ttl_cached = True
+    return wrapper
+
+
 class BaseCheck(ABC):
-    """Abstract base class for all checks."""
+    """
+    Abstract base class for all checks.
+
+    Every check accepts an optional min_interval config option (seconds):
+    repeated executions with the same configuration inside that window
+    return the previous result instead of running the check again.
+    Subclasses set DEFAULT_MIN_INTERVAL to enable this without config.
+    Only the first concrete execute() in a class hierarchy is wrapped; an
+    override of it is cached through its super().execute() call.
+    """
+
+    DEFAULT_MIN_INTERVAL = 0
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        execute = cls.__dict__.get('execute')
+        if execute is None or getattr(execute, '__isabstractmethod__', False):
+            return
+        # Wrapping an override again would make its super().execute() call
+        # take the same key's non-reentrant lock twice and deadlock
+        if any(getattr(base.__dict__.get('execute'), '_ttl_cached', False) for base in cls.__mro__[1:]):
+            return
+        cls.execute = ttl_cached(execute)
 
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
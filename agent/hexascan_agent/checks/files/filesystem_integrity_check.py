@@ -12,15 +12,50 @@ import hashlib
 import json
 import time
 import subprocess
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from typing import Dict, Any, List, Optional, Set, Tuple
 from pathlib import Path
 
 from ..base import BaseCheck, CheckResult, CheckStatus
 from ..registry import CheckRegistry
 
+try:
+    import pygit2
+except ImportError:
+    # Optional: read repository status in-process instead of running git
+    pygit2 = None
+
 logger = logging.getLogger(__name__)
 
+# Human-readable labels for git status codes
+_GIT_STATUS_LABELS = {
+    'M': 'modified',
+    'A': 'added',
+    'D': 'deleted',
+    'R': 'renamed',
+    'C': 'copied',
+    'U': 'unmerged',
+    '??': 'untracked',
+    '!!': 'ignored',
+    'MM': 'modified (staged & unstaged)',
+    'AM': 'added & modified',
+    ' M': 'modified (unstaged)',
+    ' D': 'deleted (unstaged)',
+}
+
+# Git status code to change type used for categorization
+_GIT_CHANGE_TYPES = {
+    'A': 'added',
+    'AM': 'added',
+    '??': 'added',
+    'D': 'deleted',
+    ' D': 'deleted',
+    'M': 'modified',
+    'MM': 'modified',
+    ' M': 'modified',
+    'R': 'renamed',
+}
+
 
 @CheckRegistry.register('FILESYSTEM_INTEGRITY')
 class FilesystemIntegrityCheck(BaseCheck):
@@ -660,100 +695,248 @@ class FilesystemIntegrityCheck(BaseCheck):
         }
 
         try:
-            # Get current branch
-            branch_output = self._run_git_command(
-                ['git', 'rev-parse', '--abbrev-ref', 'HEAD'],
+            # Without a user switch the repository can be read in-process
+            changes = None
+            repo_data = None
+            if not run_as_user:
+                repo_data = self._read_repo_pygit2(repo_path, compare_to)
+
+            if repo_data is not None:
+                repo_info['branch'] = repo_data['branch']
+                repo_info['remote'] = repo_data['remote']
+                repo_info['last_commit'] = repo_data['last_commit']
+                changes = repo_data['changes']
+            else:
+                self._read_repo_info_git(repo_info, repo_path, run_as_user)
+
+            if changes is None:
+                changes = self._read_changes_git(repo_info, repo_path, run_as_user, compare_to)
+
+            for status_code, file_path in changes:
+                repo_info['files'].append({
+                    'path': file_path,
+                    'full_path': os.path.join(repo_path, file_path),
+                    'status': status_code,
+                    'status_label': self._git_status_label(status_code),
+                })
+
+        except Exception as e:
+            logger.warning(f"Error getting git status for {repo_path}: {e}")
+            repo_info['error'] = str(e)
+
+        return repo_info
+
+    def _read_repo_info_git(
+        self,
+        repo_info: Dict[str, Any],
+        repo_path: str,
+        run_as_user: str
+    ) -> None:
+        """Fill branch, remote and last commit of repo_info using the git CLI."""
+        # Get current branch
+        branch_output = self._run_git_command(
+            ['git', 'rev-parse', '--abbrev-ref', 'HEAD'],
+            repo_path,
+            run_as_user
+        )
+        if branch_output:
+            repo_info['branch'] = branch_output.strip()
+
+        # Get remote URL
+        remote_output = self._run_git_command(
+            ['git', 'remote', 'get-url', 'origin'],
+            repo_path,
+            run_as_user
+        )
+        if remote_output:
+            repo_info['remote'] = remote_output.strip()
+
+        # Get last commit info
+        commit_output = self._run_git_command(
+            ['git', 'log', '-1', '--format=%H|%s|%an|%ai'],
+            repo_path,
+            run_as_user
+        )
+        if commit_output:
+            parts = commit_output.strip().split('|')
+            if len(parts) >= 4:
+                repo_info['last_commit'] = {
+                    'hash': parts[0][:8],
+                    'message': parts[1],
+                    'author': parts[2],
+                    'date': parts[3],
+                }
+
+    def _read_changes_git(
+        self,
+        repo_info: Dict[str, Any],
+        repo_path: str,
+        run_as_user: str,
+        compare_to: str
+    ) -> List[Tuple[str, str]]:
+        """
+        List changed files using the git CLI.
+
+        Returns:
+            List of (status_code, file_path) tuples
+        """
+        # Get changed files based on comparison mode
+        if compare_to == 'staged':
+            # Show staged and unstaged changes
+            status_output = self._run_git_command(
+                ['git', 'status', '--porcelain'],
                 repo_path,
                 run_as_user
             )
-            if branch_output:
-                repo_info['branch'] = branch_output.strip()
-
-            # Get remote URL
-            remote_output = self._run_git_command(
-                ['git', 'remote', 'get-url', 'origin'],
+        elif compare_to == 'remote':
+            # Compare with remote branch
+            self._run_git_command(['git', 'fetch', '--quiet'], repo_path, run_as_user)
+            remote_branch = f"origin/{repo_info['branch']}" if repo_info['branch'] else 'origin/main'
+            status_output = self._run_git_command(
+                ['git', 'diff', '--name-status', remote_branch],
                 repo_path,
                 run_as_user
             )
-            if remote_output:
-                repo_info['remote'] = remote_output.strip()
-
-            # Get last commit info
-            commit_output = self._run_git_command(
-                ['git', 'log', '-1', '--format=%H|%s|%an|%ai'],
+        elif compare_to == 'last_commit':
+            # Show changes since last commit
+            status_output = self._run_git_command(
+                ['git', 'diff', '--name-status', 'HEAD~1'],
+                repo_path,
+                run_as_user
+            )
+        else:  # 'head' - default
+            # Show all uncommitted changes (staged + unstaged + untracked)
+            status_output = self._run_git_command(
+                ['git', 'status', '--porcelain'],
                 repo_path,
                 run_as_user
             )
-            if commit_output:
-                parts = commit_output.strip().split('|')
-                if len(parts) >= 4:
-                    repo_info['last_commit'] = {
-                        'hash': parts[0][:8],
-                        'message': parts[1],
-                        'author': parts[2],
-                        'date': parts[3],
-                    }
-
-            # Get changed files based on comparison mode
-            if compare_to == 'staged':
-                # Show staged and unstaged changes
-                status_output = self._run_git_command(
-                    ['git', 'status', '--porcelain'],
-                    repo_path,
-                    run_as_user
-                )
-            elif compare_to == 'remote':
-                # Compare with remote branch
-                self._run_git_command(['git', 'fetch', '--quiet'], repo_path, run_as_user)
-                remote_branch = f"origin/{repo_info['branch']}" if repo_info['branch'] else 'origin/main'
-                status_output = self._run_git_command(
-                    ['git', 'diff', '--name-status', remote_branch],
-                    repo_path,
-                    run_as_user
-                )
-            elif compare_to == 'last_commit':
-                # Show changes since last commit
-                status_output = self._run_git_command(
-                    ['git', 'diff', '--name-status', 'HEAD~1'],
-                    repo_path,
-                    run_as_user
-                )
-            else:  # 'head' - default
-                # Show all uncommitted changes (staged + unstaged + untracked)
-                status_output = self._run_git_command(
-                    ['git', 'status', '--porcelain'],
-                    repo_path,
-                    run_as_user
-                )
 
-            if status_output:
-                for line in status_output.strip().split('\n'):
-                    if line:
-                        # Parse git status output
-                        if compare_to in ['remote', 'last_commit']:
-                            # Format: "M\tfilename" or "A\tfilename"
-                            parts = line.split('\t')
-                            if len(parts) >= 2:
-                                status_code = parts[0]
-                                file_path = parts[1]
-                        else:
-                            # Format: "XY filename" where X=staged, Y=unstaged
-                            status_code = line[:2].strip()
-                            file_path = line[3:].strip()
+        changes = []
+        if status_output:
+            for line in status_output.strip().split('\n'):
+                if line:
+                    # Parse git status output
+                    if compare_to in ['remote', 'last_commit']:
+                        # Format: "M\tfilename" or "A\tfilename"
+                        parts = line.split('\t')
+                        if len(parts) >= 2:
+                            status_code = parts[0]
+                            file_path = parts[1]
+                    else:
+                        # Format: "XY filename" where X=staged, Y=unstaged
+                        status_code = line[:2].strip()
+                        file_path = line[3:].strip()
+
+                    if file_path:
+                        changes.append((status_code, file_path))
 
-                        if file_path:
-                            repo_info['files'].append({
-                                'path': file_path,
-                                'full_path': os.path.join(repo_path, file_path),
-                                'status': status_code,
-                                'status_label': self._git_status_label(status_code),
-                            })
+        return changes
+
+    def _read_repo_pygit2(self, repo_path: str, compare_to: str) -> Optional[Dict[str, Any]]:
+        """
+        Read repository information in-process with pygit2.
+
+        Avoids forking git for every query. Changed files are only listed
+        for the 'head' and 'staged' comparisons; other modes need the git
+        CLI (fetch, diff against a ref) and return 'changes' as None.
+
+        Returns:
+            Dict with branch, remote, last_commit and changes, or None if
+            pygit2 is unavailable or cannot read the repository
+        """
+        if pygit2 is None:
+            return None
+
+        try:
+            repo = pygit2.Repository(repo_path)
+
+            branch = None
+            last_commit = None
+            if not repo.head_is_unborn:
+                branch = 'HEAD' if repo.head_is_detached else repo.head.shorthand
+                commit = repo.head.peel(pygit2.Commit)
+                author = commit.author
+                author_tz = timezone(timedelta(minutes=author.offset))
+                last_commit = {
+                    'hash': str(commit.id)[:8],
+                    # Subject as git's %s: first paragraph on one line
+                    'message': commit.message.strip().split('\n\n', 1)[0].replace('\n', ' '),
+                    'author': author.name,
+                    'date': datetime.fromtimestamp(author.time, author_tz).strftime('%Y-%m-%d %H:%M:%S %z'),
+                }
+
+            remote = None
+            try:
+                remote = repo.remotes['origin'].url
+            except (KeyError, ValueError):
+                pass
+
+            changes = None
+            if compare_to in ('staged', 'head'):
+                try:
+                    status = repo.status(untracked_files='normal')
+                except TypeError:
+                    # Older pygit2 without status() options
+                    status = repo.status()
+                changes = []
+                for file_path, flags in status.items():
+                    for status_code in self._pygit2_status_codes(flags):
+                        changes.append((status_code, file_path))
+                # Porcelain order: tracked changes first, then untracked
+                changes.sort(key=lambda c: (c[0] == '??', c[1]))
+
+            return {
+                'branch': branch,
+                'remote': remote,
+                'last_commit': last_commit,
+                'changes': changes,
+            }
 
         except Exception as e:
-            logger.warning(f"Error getting git status for {repo_path}: {e}")
-            repo_info['error'] = str(e)
+            logger.debug(f"pygit2 cannot read {repo_path}, using git: {e}")
+            return None
 
-        return repo_info
+    def _pygit2_status_codes(self, flags: int) -> List[str]:
+        """
+        Convert pygit2 status flags to `git status --porcelain` codes.
+
+        Usually one code; a file deleted from the index but still present
+        in the worktree is reported twice by git ('D' and '??').
+        """
+        if flags & pygit2.GIT_STATUS_IGNORED:
+            return []
+        if flags & pygit2.GIT_STATUS_CONFLICTED:
+            return ['UU']
+        if flags & pygit2.GIT_STATUS_WT_NEW:
+            if flags & pygit2.GIT_STATUS_INDEX_DELETED:
+                return ['D', '??']
+            return ['??']
+
+        staged = ' '
+        if flags & pygit2.GIT_STATUS_INDEX_NEW:
+            staged = 'A'
+        elif flags & pygit2.GIT_STATUS_INDEX_MODIFIED:
+            staged = 'M'
+        elif flags & pygit2.GIT_STATUS_INDEX_DELETED:
+            staged = 'D'
+        elif flags & pygit2.GIT_STATUS_INDEX_RENAMED:
+            staged = 'R'
+        elif flags & pygit2.GIT_STATUS_INDEX_TYPECHANGE:
+            staged = 'T'
+
+        unstaged = ' '
+        if flags & pygit2.GIT_STATUS_WT_MODIFIED:
+            unstaged = 'M'
+        elif flags & pygit2.GIT_STATUS_WT_DELETED:
+            unstaged = 'D'
+        elif flags & pygit2.GIT_STATUS_WT_RENAMED:
+            unstaged = 'R'
+        elif flags & pygit2.GIT_STATUS_WT_TYPECHANGE:
+            unstaged = 'T'
+
+        # Same normalization as the porcelain parser (line[:2].strip())
+        return [(staged + unstaged).strip()]
 
     def _run_git_command(
         self,
@@ -792,31 +975,8 @@ class FilesystemIntegrityCheck(BaseCheck):
 
     def _git_status_label(self, status_code: str) -> str:
         """Convert git status code to human-readable label."""
-        labels = {
-            'M': 'modified',
-            'A': 'added',
-            'D': 'deleted',
-            'R': 'renamed',
-            'C': 'copied',
-            'U': 'unmerged',
-            '??': 'untracked',
-            '!!': 'ignored',
-            'MM': 'modified (staged & unstaged)',
-            'AM': 'added & modified',
-            ' M': 'modified (unstaged)',
-            ' D': 'deleted (unstaged)',
-        }
-        return labels.get(status_code, status_code)
+        return _GIT_STATUS_LABELS.get(status_code, status_code)
 
     def _git_status_to_change_type(self, status_code: str) -> str:
         """Convert git status code to change type for categorization."""
-        if status_code in ['A', 'AM', '??']:
-            return 'added'
-        elif status_code in ['D', ' D']:
-            return 'deleted'
-        elif status_code in ['M', 'MM', ' M']:
-            return 'modified'
-        elif status_code in ['R']:
-            return 'renamed'
-        else:
-            return 'changed'
+        return _GIT_CHANGE_TYPES.get(status_code, 'changed')
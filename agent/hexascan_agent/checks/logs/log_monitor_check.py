@@ -6,21 +6,39 @@ Supports two modes:
 2. Raw display mode: Returns last N lines from log files for display
 """
 
+import bisect
 import logging
 import os
 import re
+import stat
+import threading
 import time
-from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, FrozenSet, Iterator, List, Optional, Tuple, Union
 
 from ..base import BaseCheck, CheckResult, CheckStatus
 from ..registry import CheckRegistry
 
+try:
+    import hyperscan
+except ImportError:
+    # Optional: multi-pattern scanning falls back to the re module
+    hyperscan = None
+
 logger = logging.getLogger(__name__)
 
+# Line classification used for display mode error/warning counts. Matches at
+# most once per line start: group 'e' if the line mentions an error keyword,
+# otherwise group 'w' if it mentions a warning keyword.
+_LEVEL_RE = re.compile(
+    rb'^(?:(?=[^\n]*\b(?:error|exception|fatal|critical)\b)(?P<e>)'
+    rb'|(?=[^\n]*\b(?:warning|warn)\b)(?P<w>))',
+    re.IGNORECASE | re.MULTILINE,
+)
+
 
 @dataclass
 class LogPattern:
@@ -32,9 +50,9 @@ class LogPattern:
     compiled: Optional[re.Pattern] = field(default=None, repr=False)
 
     def __post_init__(self):
-        """Compile the regex pattern."""
+        """Compile the regex pattern (as bytes, log files are scanned undecoded)."""
         try:
-            self.compiled = re.compile(self.pattern, re.IGNORECASE)
+            self.compiled = re.compile(self.pattern.encode('utf-8'), re.IGNORECASE)
         except re.error as e:
             logger.error(f"Invalid regex pattern '{self.pattern}': {e}")
             self.compiled = None
@@ -51,8 +69,8 @@ class LogMatch:
     level: str
 
 
-# Default patterns for common issues
-DEFAULT_PATTERNS = [
+# Default patterns for common issues, compiled once at import
+DEFAULT_PATTERNS = (
     # Critical patterns
     LogPattern(
         pattern=r'(fatal|panic|emergency)',
@@ -95,7 +113,73 @@ DEFAULT_PATTERNS = [
         level='info',
         description='Deprecation warnings',
     ),
-]
+)
+
+
+# Unescaped \A, \Z and \z, which anchor to the whole scanned buffer
+_BUFFER_ANCHOR_RE = re.compile(rb'(?<!\\)(?:\\\\)*\\[AZz]')
+
+
+@lru_cache(maxsize=32)
+def _compile_hyperscan_db(expressions: Tuple[bytes, ...]):
+    """
+    Compile patterns into a single hyperscan database.
+
+    Patterns are compiled for scanning the joined tail lines, with ^ and $
+    matching at line boundaries. Patterns using \\A, \\Z or \\z would anchor
+    to the whole buffer instead of each line, so they are left to re.
+
+    Returns:
+        hyperscan.Database, or None if hyperscan is unavailable or cannot
+        compile one of the expressions (the caller then falls back to re)
+    """
+    if hyperscan is None or any(_BUFFER_ANCHOR_RE.search(e) for e in expressions):
+        return None
+    try:
+        db = hyperscan.Database()
+        db.compile(
+            expressions=list(expressions),
+            ids=list(range(len(expressions))),
+            elements=len(expressions),
+            flags=hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_MULTILINE,
+        )
+        return db
+    except hyperscan.error as e:
+        logger.debug(f"Hyperscan cannot compile log patterns, using re: {e}")
+        return None
+
+
+# Per-thread (database, scratch) pair: a database is shared between threads,
+# but a scratch space can only be used by one scan at a time
+_hyperscan_local = threading.local()
+
+
+def _hyperscan_scratch(db):
+    """Get this thread's scratch space for a hyperscan database."""
+    cached = getattr(_hyperscan_local, 'scratch', None)
+    if cached is None or cached[0] is not db:
+        cached = (db, hyperscan.Scratch(db))
+        _hyperscan_local.scratch = cached
+    return cached[1]
+
+
+def _decode_line(line: bytes, max_chars: Optional[int] = None) -> str:
+    """
+    Decode a raw log line, keeping at most max_chars characters.
+
+    Only the first 4 * max_chars bytes are decoded, which always covers
+    max_chars whole UTF-8 characters, so a character split by the byte cut
+    never reaches the result.
+    """
+    if max_chars is None:
+        return line.decode('utf-8', errors='replace')
+    return line[:4 * max_chars].decode('utf-8', errors='replace')[:max_chars]
+
+
+@lru_cache(maxsize=256)
+def _compile_custom_pattern(pattern: str, level: str, description: str) -> LogPattern:
+    """Build a LogPattern for a custom pattern, reusing earlier compilations."""
+    return LogPattern(pattern=pattern, level=level, description=description)
 
 
 @CheckRegistry.register('LOG_MONITORING')
@@ -109,19 +193,34 @@ class LogMonitorCheck(BaseCheck):
         patterns: List of pattern configurations (optional, uses defaults if not provided)
         max_lines: Maximum lines to read per file (default: 300 for display, 1000 for pattern)
         max_file_size_mb: Skip files larger than this (default: 100)
+        max_line_chars: Truncate returned log lines to this many characters
+            (default: 500 for pattern matches, no limit in display mode)
         include_extensions: File extensions to include (default: ['.log', '.txt'])
 
         For display mode:
         magento_root: Path to Magento installation (auto-configures Magento logs)
         wordpress_root: Path to WordPress installation (auto-configures WordPress logs)
         include_system_logs: Whether to include system logs (default: True)
+        exact_line_count: Count every line for total_lines instead of estimating
+            it from the tail of large files (default: False)
     """
 
     DEFAULT_MAX_LINES = 1000
     DEFAULT_MAX_LINES_DISPLAY = 300
     DEFAULT_MAX_FILE_SIZE_MB = 100
+    DEFAULT_MAX_LINE_CHARS = 500
     DEFAULT_INCLUDE_EXTENSIONS = ['.log', '.txt', '']
     DEFAULT_TIME_WINDOW_HOURS = 24
+    TAIL_CHUNK_SIZE = 8192
+    COUNT_CHUNK_SIZE = 1 << 20
+
+    # Lowercase literals at least one of which appears in any line matched by
+    # DEFAULT_PATTERNS. Used as a cheap prefilter before running the regexes.
+    _LITERAL_ANCHORS = (
+        b'fatal', b'panic', b'emergency', b'out of memory', b'segmentation fault',
+        b'disk full', b'no space left', b'error', b'exception', b'fail',
+        b'permission denied', b'refused', b'timed out', b'deprecated', b'obsolete',
+    )
 
     # Common Magento log files
     MAGENTO_LOG_FILES = [
@@ -181,119 +280,60 @@ class LogMonitorCheck(BaseCheck):
         max_lines = self.config.get('max_lines', self.DEFAULT_MAX_LINES_DISPLAY)
         custom_paths = self.config.get('paths', [])
 
-        log_contents = {}
-        errors_found = 0
-        warnings_found = 0
-        files_read = 0
+        # Gather every candidate log file first, then read them in one pass.
+        # Each path is stat-ed once and the result is reused when reading.
+        candidates = []
 
         # Collect Magento logs if magento_root is provided
         if magento_root:
             for log_file in self.MAGENTO_LOG_FILES:
                 full_path = os.path.join(magento_root, log_file)
-                if os.path.exists(full_path):
-                    content, stats = self._read_log_file(full_path, max_lines)
-                    if content is not None:
-                        log_name = f"magento:{os.path.basename(log_file)}"
-                        log_contents[log_name] = {
-                            'path': full_path,
-                            'lines': content,
-                            'total_lines': stats['total_lines'],
-                            'file_size': stats['file_size'],
-                            'last_modified': stats['last_modified'],
-                            'error_count': stats['error_count'],
-                            'warning_count': stats['warning_count'],
-                        }
-                        errors_found += stats['error_count']
-                        warnings_found += stats['warning_count']
-                        files_read += 1
+                file_stat = self._stat_or_none(full_path)
+                if file_stat is not None:
+                    candidates.append((f"magento:{os.path.basename(log_file)}", full_path, file_stat))
 
         # Collect WordPress logs if wordpress_root is provided
         if wordpress_root:
             for log_file in self.WORDPRESS_LOG_FILES:
                 full_path = os.path.join(wordpress_root, log_file)
+                file_stat = self._stat_or_none(full_path)
+                if file_stat is None:
+                    continue
                 # Handle both files and directories (like wc-logs)
-                if os.path.isfile(full_path):
-                    content, stats = self._read_log_file(full_path, max_lines)
-                    if content is not None:
-                        log_name = f"wordpress:{os.path.basename(log_file)}"
-                        log_contents[log_name] = {
-                            'path': full_path,
-                            'lines': content,
-                            'total_lines': stats['total_lines'],
-                            'file_size': stats['file_size'],
-                            'last_modified': stats['last_modified'],
-                            'error_count': stats['error_count'],
-                            'warning_count': stats['warning_count'],
-                        }
-                        errors_found += stats['error_count']
-                        warnings_found += stats['warning_count']
-                        files_read += 1
-                elif os.path.isdir(full_path):
+                if stat.S_ISREG(file_stat.st_mode):
+                    candidates.append((f"wordpress:{os.path.basename(log_file)}", full_path, file_stat))
+                elif stat.S_ISDIR(file_stat.st_mode):
                     # For directories like wc-logs, read the most recent log files
                     try:
-                        log_files = sorted(
-                            [f for f in os.listdir(full_path) if f.endswith('.log')],
-                            key=lambda x: os.path.getmtime(os.path.join(full_path, x)),
-                            reverse=True
-                        )[:3]  # Get 3 most recent
-                        for lf in log_files:
+                        log_files = []
+                        for lf in os.listdir(full_path):
+                            if not lf.endswith('.log'):
+                                continue
                             lf_path = os.path.join(full_path, lf)
-                            content, stats = self._read_log_file(lf_path, max_lines)
-                            if content is not None:
-                                log_name = f"wordpress:{lf}"
-                                log_contents[log_name] = {
-                                    'path': lf_path,
-                                    'lines': content,
-                                    'total_lines': stats['total_lines'],
-                                    'file_size': stats['file_size'],
-                                    'last_modified': stats['last_modified'],
-                                    'error_count': stats['error_count'],
-                                    'warning_count': stats['warning_count'],
-                                }
-                                errors_found += stats['error_count']
-                                warnings_found += stats['warning_count']
-                                files_read += 1
+                            lf_stat = os.stat(lf_path)
+                            log_files.append((lf, lf_path, lf_stat))
+                        log_files.sort(key=lambda x: x[2].st_mtime, reverse=True)
+                        for lf, lf_path, lf_stat in log_files[:3]:  # Get 3 most recent
+                            candidates.append((f"wordpress:{lf}", lf_path, lf_stat))
                     except Exception as e:
                         logger.warning(f"Error reading WordPress log directory {full_path}: {e}")
 
         # Collect system logs if enabled
         if include_system_logs:
             for log_file in self.SYSTEM_LOG_FILES:
-                if os.path.exists(log_file):
-                    content, stats = self._read_log_file(log_file, max_lines)
-                    if content is not None:
-                        log_name = f"system:{os.path.basename(log_file)}"
-                        log_contents[log_name] = {
-                            'path': log_file,
-                            'lines': content,
-                            'total_lines': stats['total_lines'],
-                            'file_size': stats['file_size'],
-                            'last_modified': stats['last_modified'],
-                            'error_count': stats['error_count'],
-                            'warning_count': stats['warning_count'],
-                        }
-                        errors_found += stats['error_count']
-                        warnings_found += stats['warning_count']
-                        files_read += 1
+                file_stat = self._stat_or_none(log_file)
+                if file_stat is not None:
+                    candidates.append((f"system:{os.path.basename(log_file)}", log_file, file_stat))
 
         # Collect custom paths
         for custom_path in custom_paths:
-            if os.path.exists(custom_path):
-                content, stats = self._read_log_file(custom_path, max_lines)
-                if content is not None:
-                    log_name = f"custom:{os.path.basename(custom_path)}"
-                    log_contents[log_name] = {
-                        'path': custom_path,
-                        'lines': content,
-                        'total_lines': stats['total_lines'],
-                        'file_size': stats['file_size'],
-                        'last_modified': stats['last_modified'],
-                        'error_count': stats['error_count'],
-                        'warning_count': stats['warning_count'],
-                    }
-                    errors_found += stats['error_count']
-                    warnings_found += stats['warning_count']
-                    files_read += 1
+            file_stat = self._stat_or_none(custom_path)
+            if file_stat is not None:
+                candidates.append((f"custom:{os.path.basename(custom_path)}", custom_path, file_stat))
+
+        log_contents, files_read, errors_found, warnings_found = self._collect_tails(
+            candidates, max_lines
+        )
 
         duration = int((time.time() - start_time) * 1000)
 
@@ -340,15 +380,72 @@ class LogMonitorCheck(BaseCheck):
             duration=duration,
         )
 
-    def _read_log_file(self, file_path: str, max_lines: int) -> tuple:
+    def _collect_tails(self, candidates: List[tuple], max_lines: int) -> tuple:
+        """
+        Read the tail of every candidate log file in a single pass.
+
+        Args:
+            candidates: List of (log_name, path, stat_result) tuples
+            max_lines: Maximum lines to read per file
+
+        Returns:
+            Tuple of (log_contents, files_read, errors_found, warnings_found)
+        """
+        log_contents = {}
+        files_read = 0
+        errors_found = 0
+        warnings_found = 0
+        seen = set()
+
+        for log_name, path, file_stat in candidates:
+            # The same file can be reachable through several configured paths
+            if not self._mark_seen(seen, file_stat):
+                continue
+            content, stats = self._read_log_file(path, max_lines, file_stat)
+            if content is None:
+                continue
+            log_contents[log_name] = {
+                'path': path,
+                'lines': content,
+                'total_lines': stats['total_lines'],
+                'file_size': stats['file_size'],
+                'last_modified': stats['last_modified'],
+                'error_count': stats['error_count'],
+                'warning_count': stats['warning_count'],
+            }
+            errors_found += stats['error_count']
+            warnings_found += stats['warning_count']
+            files_read += 1
+
+        return log_contents, files_read, errors_found, warnings_found
+
+    def _stat_or_none(self, path: str) -> Optional[os.stat_result]:
+        """Stat a path, returning None if it is missing or inaccessible."""
+        try:
+            return os.stat(path)
+        except OSError:
+            return None
+
+    def _read_log_file(
+        self,
+        file_path: str,
+        max_lines: int,
+        file_stat: Optional[os.stat_result] = None,
+    ) -> tuple:
         """
         Read the last N lines from a log file.
 
+        Args:
+            file_path: Path to the log file
+            max_lines: Maximum lines to return
+            file_stat: Stat result for the file, if the caller already has one
+
         Returns:
             Tuple of (lines_list, stats_dict) or (None, None) if failed
         """
         try:
-            file_stat = os.stat(file_path)
+            if file_stat is None:
+                file_stat = os.stat(file_path)
             file_size = file_stat.st_size
             last_modified = datetime.fromtimestamp(file_stat.st_mtime).isoformat()
 
@@ -358,27 +455,37 @@ class LogMonitorCheck(BaseCheck):
                 return None, None
 
             # Read last N lines efficiently
-            lines = self._tail_file_efficient(file_path, max_lines)
+            lines, tail_bytes, tail_newlines = self._tail_file_efficient(file_path, max_lines)
 
-            # Count errors and warnings in the content
+            # Count errors and warnings in the raw bytes with a single scan
             error_count = 0
             warning_count = 0
-            error_pattern = re.compile(r'\b(error|exception|fatal|critical)\b', re.IGNORECASE)
-            warning_pattern = re.compile(r'\b(warning|warn)\b', re.IGNORECASE)
 
-            for line in lines:
-                if error_pattern.search(line):
+            for match in _LEVEL_RE.finditer(b'\n'.join(lines)):
+                if match.lastgroup == 'e':
                     error_count += 1
-                elif warning_pattern.search(line):
+                else:
                     warning_count += 1
 
-            # Count total lines in file
-            total_lines = self._count_lines(file_path)
+            # Lines are returned in full unless max_line_chars is configured
+            max_line_chars = self.config.get('max_line_chars')
+            lines = [_decode_line(line, max_line_chars) for line in lines]
+
+            # Count total lines in file. The tail scan already covers small
+            # files exactly; for larger ones extrapolate from the average line
+            # length of the tail unless an exact count is requested. An empty
+            # tail means the file was truncated (e.g. copytruncate rotation)
+            # since it was stat'ed.
+            if self.config.get('exact_line_count', False):
+                total_lines = self._count_lines(file_path)
+            elif tail_bytes >= file_size or not tail_bytes:
+                total_lines = tail_newlines
+            else:
+                total_lines = int(file_size / (tail_bytes / max(tail_newlines, 1)))
 
             stats = {
                 'total_lines': total_lines,
                 'file_size': file_size,
-                'file_size_human': self._format_size(file_size),
                 'last_modified': last_modified,
                 'error_count': error_count,
                 'warning_count': warning_count,
@@ -390,11 +497,16 @@ class LogMonitorCheck(BaseCheck):
             logger.warning(f"Cannot read file {file_path}: {e}")
             return None, None
 
-    def _tail_file_efficient(self, file_path: str, n: int) -> List[str]:
+    def _tail_file_efficient(self, file_path: str, n: int) -> tuple:
         """
         Efficiently read the last n lines from a file.
         Uses a simple and reliable approach: read from end in chunks,
         accumulate lines, stop when we have enough.
+
+        Returns:
+            Tuple of (lines, bytes_read, line_count) where lines are undecoded
+            bytes and line_count is the number of lines in the bytes read
+            (exact when the whole file was read)
         """
         try:
             with open(file_path, 'rb') as f:
@@ -403,41 +515,46 @@ class LogMonitorCheck(BaseCheck):
                 file_size = f.tell()
 
                 if file_size == 0:
-                    return []
-
-                # Read from end in chunks
-                buffer_size = 8192
-                buffer = b''
-                position = file_size
-                read_entire_file = False
-
-                while position > 0:
-                    # Calculate how much to read
-                    read_size = min(buffer_size, position)
-                    position -= read_size
-
-                    # Seek and read
-                    f.seek(position)
-                    chunk = f.read(read_size)
-                    buffer = chunk + buffer
-
-                    # Check if we read the entire file
-                    if position == 0:
-                        read_entire_file = True
-
-                    # Count newlines - if we have enough, stop reading
-                    # We need n+1 newlines to get n complete lines (plus potential partial first line)
-                    if buffer.count(b'\n') >= n + 1:
-                        break
-
-                # Decode buffer
-                try:
-                    text = buffer.decode('utf-8', errors='replace')
-                except:
-                    text = buffer.decode('latin-1', errors='replace')
+                    return [], 0, 0
+
+                buffer_size = self.TAIL_CHUNK_SIZE
+
+                if file_size <= buffer_size:
+                    # Small file (the common case): a single read, no backward scan
+                    f.seek(0)
+                    buffer = f.read()
+                    read_entire_file = True
+                else:
+                    # Read from end in chunks
+                    buffer = b''
+                    position = file_size
+                    read_entire_file = False
+
+                    while position > 0:
+                        # Calculate how much to read
+                        read_size = min(buffer_size, position)
+                        position -= read_size
+
+                        # Seek and read
+                        f.seek(position)
+                        chunk = f.read(read_size)
+                        buffer = chunk + buffer
+
+                        # Check if we read the entire file
+                        if position == 0:
+                            read_entire_file = True
+
+                        # Count newlines - if we have enough, stop reading
+                        # We need n+1 newlines to get n complete lines (plus potential partial first line)
+                        if buffer.count(b'\n') >= n + 1:
+                            break
+
+                line_count = buffer.count(b'\n')
+                if read_entire_file and not buffer.endswith(b'\n'):
+                    line_count += 1
 
                 # Split into lines
-                all_lines = text.split('\n')
+                all_lines = buffer.split(b'\n')
 
                 # If we didn't read the entire file, the first "line" is partial - discard it
                 if not read_entire_file and len(all_lines) > 0:
@@ -447,33 +564,48 @@ class LogMonitorCheck(BaseCheck):
                 all_lines = [line.strip() for line in all_lines if line.strip()]
 
                 # Return last n lines
-                return all_lines[-n:] if len(all_lines) > n else all_lines
+                tail = all_lines[-n:] if len(all_lines) > n else all_lines
+                return tail, len(buffer), line_count
 
         except Exception as e:
             logger.warning(f"Error reading file {file_path}: {e}")
             # Fallback to simple read
             try:
-                with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
+                with open(file_path, 'rb') as f:
                     all_lines = f.readlines()
-                    return [l.strip() for l in all_lines[-n:] if l.strip()]
+                    tail = [l.strip() for l in all_lines[-n:] if l.strip()]
+                    return tail, os.path.getsize(file_path), len(all_lines)
             except:
-                return []
+                return [], 0, 0
 
     def _count_lines(self, file_path: str) -> int:
-        """Count total lines in a file efficiently."""
+        """
+        Count total lines in a file efficiently.
+
+        Counts newlines in 1 MiB chunks with bytes.count (memchr speed)
+        instead of materializing a Python object per line.
+        """
         try:
-            with open(file_path, 'rb') as f:
-                return sum(1 for _ in f)
-        except:
+            fd = os.open(file_path, os.O_RDONLY)
+        except OSError:
             return 0
-
-    def _format_size(self, size_bytes: int) -> str:
-        """Format file size in human readable format."""
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size_bytes < 1024:
-                return f"{size_bytes:.1f} {unit}"
-            size_bytes /= 1024
-        return f"{size_bytes:.1f} TB"
+        try:
+            count = 0
+            last = b''
+            while True:
+                chunk = os.read(fd, self.COUNT_CHUNK_SIZE)
+                if not chunk:
+                    break
+                count += chunk.count(b'\n')
+                last = chunk
+            # A trailing line without a newline still counts as a line
+            if last and not last.endswith(b'\n'):
+                count += 1
+            return count
+        except OSError:
+            return 0
+        finally:
+            os.close(fd)
 
     def _execute_pattern_mode(self, start_time: float) -> CheckResult:
         """
@@ -512,7 +644,9 @@ class LogMonitorCheck(BaseCheck):
                 )
 
             # Analyze logs
-            matches = self._analyze_logs(log_files, patterns, max_lines)
+            # The literal prefilter only covers the default patterns
+            anchors = None if custom_patterns else self._LITERAL_ANCHORS
+            matches = self._analyze_logs(log_files, patterns, max_lines, anchors)
             duration = int((time.time() - start_time) * 1000)
 
             # Categorize matches
@@ -561,7 +695,7 @@ class LogMonitorCheck(BaseCheck):
                 duration=duration,
             )
 
-    def _build_patterns(self, custom_patterns: List[Dict[str, Any]]) -> List[LogPattern]:
+    def _build_patterns(self, custom_patterns: List[Dict[str, Any]]) -> Tuple[LogPattern, ...]:
         """
         Build pattern list from defaults and custom patterns.
 
@@ -569,20 +703,22 @@ class LogMonitorCheck(BaseCheck):
             custom_patterns: Custom pattern configurations
 
         Returns:
-            List of LogPattern objects
+            Tuple of LogPattern objects
         """
-        patterns = list(DEFAULT_PATTERNS)
-
-        for custom in custom_patterns:
-            pattern = LogPattern(
-                pattern=custom.get('pattern', ''),
-                level=custom.get('level', 'warning'),
-                description=custom.get('description', ''),
+        if not custom_patterns:
+            return DEFAULT_PATTERNS
+
+        custom = []
+        for cfg in custom_patterns:
+            pattern = _compile_custom_pattern(
+                cfg.get('pattern', ''),
+                cfg.get('level', 'warning'),
+                cfg.get('description', ''),
             )
             if pattern.compiled:
-                patterns.append(pattern)
+                custom.append(pattern)
 
-        return patterns
+        return DEFAULT_PATTERNS + tuple(custom)
 
     def _collect_log_files(
         self,
@@ -603,6 +739,11 @@ class LogMonitorCheck(BaseCheck):
         """
         log_files = []
         max_size_bytes = max_file_size_mb * 1024 * 1024
+        # Normalized once; checked for every file found
+        ext_set = frozenset(ext.lower() for ext in include_extensions)
+        # (st_dev, st_ino) of files already collected, so overlapping paths,
+        # symlinks and hard links are only analyzed once
+        seen = set()
 
         for path_str in paths:
             path = Path(path_str)
@@ -612,41 +753,81 @@ class LogMonitorCheck(BaseCheck):
                 continue
 
             if path.is_file():
-                if self._should_include_file(path, include_extensions, max_size_bytes):
-                    log_files.append(str(path))
+                if self._should_include_file(path, ext_set, max_size_bytes):
+                    if self._mark_seen(seen, path.stat()):
+                        log_files.append(str(path))
             elif path.is_dir():
-                for file_path in path.rglob('*'):
-                    if file_path.is_file():
-                        if self._should_include_file(file_path, include_extensions, max_size_bytes):
-                            log_files.append(str(file_path))
+                for entry in self._walk_files(path_str):
+                    if self._should_include_file(entry, ext_set, max_size_bytes):
+                        if self._mark_seen(seen, entry.stat()):
+                            log_files.append(entry.path)
 
         return log_files
 
+    def _mark_seen(self, seen: set, file_stat: os.stat_result) -> bool:
+        """
+        Record a file by device and inode.
+
+        Returns:
+            True if the file had not been seen before
+        """
+        key = (file_stat.st_dev, file_stat.st_ino)
+        if key in seen:
+            return False
+        seen.add(key)
+        return True
+
+    def _walk_files(self, root: str) -> Iterator[os.DirEntry]:
+        """
+        Recursively yield regular files below a directory.
+
+        Uses os.scandir so the directory entry's cached type and stat
+        information is reused instead of stat-ing every path again.
+
+        Args:
+            root: Directory to walk
+
+        Yields:
+            DirEntry for each file found
+        """
+        stack = [root]
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file():
+                            yield entry
+            except OSError as e:
+                logger.debug(f"Cannot scan directory {directory}: {e}")
+
     def _should_include_file(
         self,
-        path: Path,
-        include_extensions: List[str],
+        path: Union[Path, os.DirEntry],
+        include_extensions: FrozenSet[str],
         max_size_bytes: float,
     ) -> bool:
         """
         Check if a file should be included in analysis.
 
         Args:
-            path: File path
-            include_extensions: Allowed extensions
+            path: File path or directory entry
+            include_extensions: Allowed lowercase extensions
             max_size_bytes: Maximum file size
 
         Returns:
             True if file should be included
         """
-        # Check extension
-        if path.suffix.lower() not in include_extensions:
+        # Check extension before touching the filesystem
+        if os.path.splitext(path.name)[1].lower() not in include_extensions:
             return False
 
         # Check size
         try:
             if path.stat().st_size > max_size_bytes:
-                logger.debug(f"Skipping large file: {path}")
+                logger.debug(f"Skipping large file: {os.fspath(path)}")
                 return False
         except OSError:
             return False
@@ -658,6 +839,7 @@ class LogMonitorCheck(BaseCheck):
         log_files: List[str],
         patterns: List[LogPattern],
         max_lines: int,
+        anchors: Optional[tuple] = None,
     ) -> List[LogMatch]:
         """
         Analyze log files for pattern matches.
@@ -666,6 +848,8 @@ class LogMonitorCheck(BaseCheck):
             log_files: List of log file paths
             patterns: Patterns to search for
             max_lines: Maximum lines to read per file
+            anchors: Lowercase literals required for any pattern to match,
+                used to skip files and lines without running the regexes
 
         Returns:
             List of LogMatch objects
@@ -674,7 +858,7 @@ class LogMonitorCheck(BaseCheck):
 
         for file_path in log_files:
             try:
-                file_matches = self._analyze_file(file_path, patterns, max_lines)
+                file_matches = self._analyze_file(file_path, patterns, max_lines, anchors)
                 matches.extend(file_matches)
             except Exception as e:
                 logger.warning(f"Error analyzing {file_path}: {e}")
@@ -686,6 +870,7 @@ class LogMonitorCheck(BaseCheck):
         file_path: str,
         patterns: List[LogPattern],
         max_lines: int,
+        anchors: Optional[tuple] = None,
     ) -> List[LogMatch]:
         """
         Analyze a single log file.
@@ -694,28 +879,51 @@ class LogMonitorCheck(BaseCheck):
             file_path: Path to log file
             patterns: Patterns to search for
             max_lines: Maximum lines to read
+            anchors: Optional literal prefilter (see _analyze_logs)
 
         Returns:
             List of matches found
         """
         matches = []
+        max_line_chars = self.config.get('max_line_chars', self.DEFAULT_MAX_LINE_CHARS)
 
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                # Read last N lines (tail)
-                lines = self._tail_file(f, max_lines)
+            # Read last N lines (tail) by seeking backwards from the end
+            lines, _, _ = self._tail_file_efficient(file_path, max_lines)
+
+            # Skip the whole file when no anchor literal occurs anywhere
+            if anchors is not None:
+                blob = b'\n'.join(lines).lower()
+                if not any(anchor in blob for anchor in anchors):
+                    return matches
+
+            active = [p for p in patterns if p.compiled]
+            first_matches = self._match_lines_hyperscan(lines, active)
+            if first_matches is not None:
+                for index in sorted(first_matches):
+                    pattern = active[first_matches[index]]
+                    matches.append(LogMatch(
+                        file_path=file_path,
+                        line_number=index + 1,
+                        line=_decode_line(lines[index], max_line_chars),
+                        pattern=pattern.pattern,
+                        level=pattern.level,
+                    ))
+                return matches
 
             for line_num, line in enumerate(lines, 1):
-                line = line.strip()
-                if not line:
-                    continue
+                if anchors is not None:
+                    line_lower = line.lower()
+                    if not any(anchor in line_lower for anchor in anchors):
+                        continue
 
                 for pattern in patterns:
                     if pattern.compiled and pattern.compiled.search(line):
                         matches.append(LogMatch(
                             file_path=file_path,
                             line_number=line_num,
-                            line=line[:500],  # Truncate long lines
+                            # Only matched lines are decoded, truncated first
+                            line=_decode_line(line, max_line_chars),
                             pattern=pattern.pattern,
                             level=pattern.level,
                         ))
@@ -726,21 +934,64 @@ class LogMonitorCheck(BaseCheck):
 
         return matches
 
-    def _tail_file(self, f, n: int) -> List[str]:
+    def _match_lines_hyperscan(
+        self,
+        lines: List[bytes],
+        patterns: List[LogPattern],
+    ) -> Optional[Dict[int, int]]:
         """
-        Read last n lines from file.
+        Match all lines against all patterns in a single hyperscan pass.
+
+        The lines are scanned joined by newlines, which finds every line
+        where some match ends. A match reported there may still have
+        started on an earlier line, so each of those lines (usually few) is
+        scanned again on its own to get exactly what re.search() would find
+        on it. Lines without a reported match cannot match at all.
 
         Args:
-            f: File object
-            n: Number of lines to read
+            lines: Tail lines of a file
+            patterns: Compiled patterns, in priority order
 
         Returns:
-            List of lines
+            Mapping of line index to the index of the first pattern that
+            matched it, or None when hyperscan is not usable
         """
-        # Simple approach: read all and take last n
-        # For very large files, a more efficient approach would be needed
-        lines = f.readlines()
-        return lines[-n:] if len(lines) > n else lines
+        if not lines or not patterns:
+            return None
+        db = _compile_hyperscan_db(tuple(p.compiled.pattern for p in patterns))
+        if db is None:
+            return None
+
+        # Start and end offset of every line in the joined buffer
+        starts = []
+        ends = []
+        offset = 0
+        for line in lines:
+            starts.append(offset)
+            offset += len(line)
+            ends.append(offset)
+            offset += 1
+
+        scratch = _hyperscan_scratch(db)
+        candidates = set()
+
+        def on_candidate(pattern_id, start, end, flags, context):
+            index = bisect.bisect_right(starts, end - 1) - 1
+            # A match ending on the line break itself spans lines
+            if end <= ends[index]:
+                candidates.add(index)
+
+        first_matches = {}
+
+        def on_match(pattern_id, start, end, flags, index):
+            current = first_matches.get(index)
+            if current is None or pattern_id < current:
+                first_matches[index] = pattern_id
+
+        db.scan(b'\n'.join(lines), match_event_handler=on_candidate, scratch=scratch)
+        for index in candidates:
+            db.scan(lines[index], match_event_handler=on_match, context=index, scratch=scratch)
+        return first_matches
 
     def _match_to_dict(self, match: LogMatch) -> Dict[str, Any]:
         """Convert LogMatch to dictionary."""
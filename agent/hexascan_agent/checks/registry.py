@@ -3,7 +3,9 @@ Check registry for dynamic check discovery and instantiation.
 """
 
 import logging
-from typing import Dict, Type, Optional, Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Mapping, Type, Optional, Any
 
 from .base import BaseCheck
 
@@ -17,7 +19,8 @@ class CheckRegistry:
     Allows dynamic registration and instantiation of checks.
     """
 
-    _checks: Dict[str, Type[BaseCheck]] = {}
+    _checks: Mapping[str, Type[BaseCheck]] = {}
+    _frozen = False
 
     @classmethod
     def register(cls, check_type: str):
@@ -33,25 +36,31 @@ class CheckRegistry:
                 ...
         """
         def decorator(check_class: Type[BaseCheck]):
+            if cls._frozen:
+                raise RuntimeError(f"Cannot register check type '{check_type}': registry is frozen")
             if check_type in cls._checks:
-                logger.warning(f"Check type '{check_type}' already registered, overwriting")
+                logger.warning("Check type '%s' already registered, overwriting", check_type)
             cls._checks[check_type] = check_class
-            logger.debug(f"Registered check type: {check_type}")
+            cls.get.cache_clear()
+            logger.debug("Registered check type: %s", check_type)
             return check_class
         return decorator
 
-    @classmethod
-    def get(cls, check_type: str) -> Optional[Type[BaseCheck]]:
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def get(check_type: str) -> Optional[Type[BaseCheck]]:
         """
         Get a check class by type.
 
+        Lookups are memoized; register() and clear() invalidate the cache.
+
         Args:
             check_type: Check type identifier
 
         Returns:
             Check class or None if not found
         """
-        return cls._checks.get(check_type)
+        return CheckRegistry._checks.get(check_type)
 
     @classmethod
     def create(cls, check_type: str, config: Optional[Dict[str, Any]] = None) -> Optional[BaseCheck]:
@@ -67,10 +76,22 @@ class CheckRegistry:
         """
         check_class = cls.get(check_type)
         if check_class is None:
-            logger.error(f"Unknown check type: {check_type}")
+            logger.error("Unknown check type: %s", check_type)
             return None
         return check_class(config=config)
 
+    @classmethod
+    def freeze(cls):
+        """
+        Make the registry read-only once all checks have been imported.
+
+        Called at agent startup; later register() calls raise RuntimeError.
+        """
+        if not cls._frozen:
+            cls._checks = MappingProxyType(dict(cls._checks))
+            cls._frozen = True
+            cls.get.cache_clear()
+
     @classmethod
     def list_types(cls) -> list:
         """
@@ -83,5 +104,7 @@ class CheckRegistry:
 
     @classmethod
     def clear(cls):
-        """Clear all registered checks (mainly for testing)."""
-        cls._checks.clear()
+        """Clear all registered checks and unfreeze (mainly for testing)."""
+        cls._checks = {}
+        cls._frozen = False
+        cls.get.cache_clear()
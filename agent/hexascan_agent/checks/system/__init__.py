@@ -2,6 +2,10 @@
 System checks for monitoring server resources.
 
 Includes disk, CPU, memory, and combined system health monitoring.
+
+The submodules are imported eagerly on purpose: each one registers its
+check with CheckRegistry at import time, so deferring them would leave
+the check types unknown to the agent.
 """
 
 from .disk_check import DiskUsageCheck
@@ -3,32 +3,75 @@ CPU usage check implementation.
 """
 
 import logging
+import threading
 import time
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
 
 import psutil
 
 from ..base import BaseCheck, CheckResult, CheckStatus
 from ..registry import CheckRegistry
+from .sampler import SystemSampler
 
 logger = logging.getLogger(__name__)
 
+# CPU topology does not change while the agent runs
+_CPU_COUNT_PHYSICAL = psutil.cpu_count(logical=False) or 0
+_CPU_COUNT_LOGICAL = psutil.cpu_count(logical=True) or 0
+
+
+def _probe_loadavg() -> bool:
+    """Check once whether this platform can report load averages."""
+    try:
+        psutil.getloadavg()
+        return True
+    except (AttributeError, OSError):
+        return False
+
+
+_HAS_LOADAVG = _probe_loadavg()
+
 
 @CheckRegistry.register('CPU_USAGE')
 class CpuUsageCheck(BaseCheck):
     """
     Check CPU usage.
 
+    CPU usage is measured by SystemSampler as the delta since the previous
+    sample rather than by sleeping for sample_interval. Once sampling has
+    been primed (see SystemSampler.prime()), a check never blocks; checks
+    run more often than the sampling window reuse the last measured value.
+
+    The window adapts to load stability: while usage stays steady it doubles
+    from sample_interval up to max_sample_interval, and it drops back to
+    sample_interval as soon as usage moves or the check status changes.
+
     Configuration options:
         warning_threshold: Percentage threshold for warning (default: 80)
         critical_threshold: Percentage threshold for critical (default: 95)
-        sample_interval: CPU sampling interval in seconds (default: 1)
+        sample_interval: Minimum CPU sampling window in seconds (default: 1)
+        max_sample_interval: Upper bound for the adaptive window in seconds;
+            set equal to sample_interval to disable adaptation (default: 10)
         per_cpu: Include per-CPU statistics (default: False)
     """
 
     DEFAULT_WARNING_THRESHOLD = 80
     DEFAULT_CRITICAL_THRESHOLD = 95
     DEFAULT_SAMPLE_INTERVAL = 1
+    DEFAULT_MAX_SAMPLE_INTERVAL = 10
+    STEADY_DELTA = 2.0  # Smoothed change in percentage points considered steady
+    STEADY_SAMPLES = 3  # Consecutive steady samples before widening the window
+    DELTA_SMOOTHING = 0.3  # EWMA weight of the newest change
+
+    # Adaptive sampling window state, shared across instances and updated
+    # from concurrent task threads under _window_lock
+    _window_lock = threading.Lock()
+    _window: Optional[float] = None
+    _last_taken_at = 0.0
+    _last_percent: Optional[float] = None
+    _delta_ewma = 0.0
+    _steady_count = 0
+    _last_status: Optional[CheckStatus] = None
 
     @property
     def name(self) -> str:
@@ -45,16 +88,18 @@ class CpuUsageCheck(BaseCheck):
         Returns:
             CheckResult with CPU usage information
         """
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
 
-        warning_threshold = self.config.get('warning_threshold', self.DEFAULT_WARNING_THRESHOLD)
-        critical_threshold = self.config.get('critical_threshold', self.DEFAULT_CRITICAL_THRESHOLD)
-        sample_interval = self.config.get('sample_interval', self.DEFAULT_SAMPLE_INTERVAL)
-        per_cpu = self.config.get('per_cpu', False)
+        cfg_get = self.config.get
+        warning_threshold = cfg_get('warning_threshold', self.DEFAULT_WARNING_THRESHOLD)
+        critical_threshold = cfg_get('critical_threshold', self.DEFAULT_CRITICAL_THRESHOLD)
+        sample_interval = cfg_get('sample_interval', self.DEFAULT_SAMPLE_INTERVAL)
+        max_sample_interval = cfg_get('max_sample_interval', self.DEFAULT_MAX_SAMPLE_INTERVAL)
+        per_cpu = cfg_get('per_cpu', False)
 
         try:
-            cpu_info = self._get_cpu_usage(sample_interval, per_cpu)
-            duration = int((time.time() - start_time) * 1000)
+            cpu_info = self._get_cpu_usage(sample_interval, max_sample_interval, per_cpu)
+            duration = (time.monotonic_ns() - start_ns) // 1_000_000
 
             cpu_percent = cpu_info['percent']
 
@@ -72,6 +117,14 @@ class CpuUsageCheck(BaseCheck):
                 score = 100
                 message = f"CPU usage normal: {cpu_percent:.1f}%"
 
+            cls = type(self)
+            with cls._window_lock:
+                if status != cls._last_status:
+                    # Threshold crossed: go back to full resolution
+                    cls._last_status = status
+                    cls._window = sample_interval
+                    cls._steady_count = 0
+
             return CheckResult(
                 status=status,
                 score=score,
@@ -82,6 +135,7 @@ class CpuUsageCheck(BaseCheck):
                     'cpu_count_logical': cpu_info['cpu_count_logical'],
                     'load_average': cpu_info.get('load_average'),
                     'per_cpu_percent': cpu_info.get('per_cpu_percent'),
+                    'sample_window': cpu_info['sample_window'],
                     'warning_threshold': warning_threshold,
                     'critical_threshold': critical_threshold,
                 },
@@ -89,8 +143,8 @@ class CpuUsageCheck(BaseCheck):
             )
 
         except Exception as e:
-            duration = int((time.time() - start_time) * 1000)
-            logger.error(f"CPU check failed: {e}")
+            duration = (time.monotonic_ns() - start_ns) // 1_000_000
+            logger.error("CPU check failed: %s", e)
             return CheckResult(
                 status=CheckStatus.ERROR,
                 score=0,
@@ -101,6 +155,7 @@ class CpuUsageCheck(BaseCheck):
     def _get_cpu_usage(
         self,
         sample_interval: float,
+        max_sample_interval: float,
         per_cpu: bool,
     ) -> Dict[str, Any]:
         """
@@ -108,39 +163,93 @@ class CpuUsageCheck(BaseCheck):
 
         Args:
             sample_interval: Interval for CPU percentage calculation
+            max_sample_interval: Upper bound for the adaptive sampling window
             per_cpu: Whether to include per-CPU statistics
 
         Returns:
             Dictionary with CPU usage information
         """
-        # Get overall CPU percentage (blocking call)
-        cpu_percent = psutil.cpu_percent(interval=sample_interval)
-
-        # Get CPU counts
-        cpu_count = psutil.cpu_count(logical=False) or 0
-        cpu_count_logical = psutil.cpu_count(logical=True) or 0
+        cpu_percent, per_cpu_percent = self._sample_cpu_percent(sample_interval, max_sample_interval)
 
         cpu_info = {
             'percent': cpu_percent,
-            'cpu_count': cpu_count,
-            'cpu_count_logical': cpu_count_logical,
+            'sample_window': type(self)._window,
+            'cpu_count': _CPU_COUNT_PHYSICAL,
+            'cpu_count_logical': _CPU_COUNT_LOGICAL,
         }
 
-        # Get load average (Unix only)
-        try:
-            load_avg = psutil.getloadavg()
+        # Get load average where the platform supports it
+        if _HAS_LOADAVG:
+            load_1, load_5, load_15 = psutil.getloadavg()
             cpu_info['load_average'] = {
-                '1min': round(load_avg[0], 2),
-                '5min': round(load_avg[1], 2),
-                '15min': round(load_avg[2], 2),
+                '1min': round(load_1, 2),
+                '5min': round(load_5, 2),
+                '15min': round(load_15, 2),
             }
-        except (AttributeError, OSError):
-            # Windows doesn't support getloadavg
+        else:
             cpu_info['load_average'] = None
 
         # Get per-CPU percentages if requested
         if per_cpu:
-            per_cpu_percent = psutil.cpu_percent(interval=0.1, percpu=True)
             cpu_info['per_cpu_percent'] = per_cpu_percent
 
         return cpu_info
+
+    def _sample_cpu_percent(
+        self,
+        sample_interval: float,
+        max_sample_interval: float,
+    ) -> Tuple[float, List[float]]:
+        """
+        Get overall and per-CPU percentages over at least sample_interval seconds.
+
+        Both figures cover the same window, so requesting per-CPU statistics
+        never adds a second sampling delay.
+
+        Args:
+            sample_interval: Minimum sampling window in seconds
+            max_sample_interval: Upper bound for the adaptive sampling window
+
+        Returns:
+            Tuple of (CPU usage percentage, per-CPU usage percentages)
+        """
+        cls = type(self)
+        with cls._window_lock:
+            window = min(max(cls._window or sample_interval, sample_interval), max_sample_interval)
+            cls._window = window
+
+        # Not under the lock: this may wait for the rest of the sampling window
+        sample = SystemSampler.cpu_sample(min_window=sample_interval, max_age=window)
+
+        with cls._window_lock:
+            if sample.taken_at != cls._last_taken_at:
+                if cls._last_percent is not None:
+                    self._adapt_window(abs(sample.percent - cls._last_percent), sample_interval, max_sample_interval)
+                cls._last_taken_at = sample.taken_at
+                cls._last_percent = sample.percent
+
+        return sample.percent, sample.per_cpu
+
+    def _adapt_window(self, delta: float, sample_interval: float, max_sample_interval: float):
+        """
+        Widen the sampling window while CPU usage is steady, reset it otherwise.
+
+        Caller holds _window_lock.
+
+        Args:
+            delta: Absolute change since the previous sample, in percentage points
+            sample_interval: Minimum sampling window in seconds
+            max_sample_interval: Upper bound for the sampling window
+        """
+        cls = type(self)
+        cls._delta_ewma += self.DELTA_SMOOTHING * (delta - cls._delta_ewma)
+
+        if cls._delta_ewma >= self.STEADY_DELTA:
+            cls._window = sample_interval
+            cls._steady_count = 0
+            return
+
+        cls._steady_count += 1
+        if cls._steady_count >= self.STEADY_SAMPLES:
+            cls._window = min(cls._window * 2, max_sample_interval)
+            cls._steady_count = 0
@@ -3,8 +3,12 @@ Disk usage check implementation.
 """
 
 import logging
+import os
+import sys
+import threading
 import time
-from typing import Dict, Any, Optional, List
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Dict, Any, Iterable, NamedTuple, Optional, List, Tuple
 
 import psutil
 
@@ -13,6 +17,62 @@ from ..registry import CheckRegistry
 
 logger = logging.getLogger(__name__)
 
+_GB = float(1 << 30)
+
+# Per-disk fragment of the status message: mountpoint and usage percent
+_DISK_MSG_FMT = '%s (%.1f%%)'
+
+
+if sys.platform.startswith('linux'):
+    _statvfs = os.statvfs
+
+    def _disk_usage(path: str) -> Tuple[int, int, int, float]:
+        """
+        Get (total, used, free, percent) for a path straight from statvfs.
+
+        Same figures as psutil.disk_usage(): free and percent are from the
+        point of view of an unprivileged user, excluding reserved blocks.
+        """
+        st = _statvfs(path)
+        frsize = st.f_frsize
+        total = st.f_blocks * frsize
+        used = total - st.f_bfree * frsize
+        free = st.f_bavail * frsize
+        total_user = used + free
+        percent = round(used / total_user * 100, 1) if total_user else 0.0
+        return total, used, free, percent
+else:
+    def _disk_usage(path: str) -> Tuple[int, int, int, float]:
+        """Get (total, used, free, percent) for a path via psutil."""
+        return tuple(psutil.disk_usage(path))
+
+
+class DiskEntry(NamedTuple):
+    """Raw usage figures for one mount; GB values are derived in to_dict()."""
+    mountpoint: str
+    device: str
+    fstype: str
+    total_bytes: int
+    used_bytes: int
+    free_bytes: int
+    percent: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert entry to dictionary for the check details."""
+        mountpoint, device, fstype, total, used, free, percent = self
+        return {
+            'mountpoint': mountpoint,
+            'device': device,
+            'fstype': fstype,
+            'total_bytes': total,
+            'used_bytes': used,
+            'free_bytes': free,
+            'percent': percent,
+            'total_gb': round(total / _GB, 2),
+            'used_gb': round(used / _GB, 2),
+            'free_gb': round(free / _GB, 2),
+        }
+
 
 @CheckRegistry.register('DISK_USAGE')
 class DiskUsageCheck(BaseCheck):
@@ -29,6 +89,59 @@ class DiskUsageCheck(BaseCheck):
     DEFAULT_WARNING_THRESHOLD = 80
     DEFAULT_CRITICAL_THRESHOLD = 90
     DEFAULT_EXCLUDE_TYPES = ['tmpfs', 'devtmpfs', 'squashfs', 'overlay']
+    PARTITIONS_TTL = 60  # Seconds to reuse the mounted partition list
+    USAGE_TIMEOUT = 5  # Seconds to wait for statvfs on all mounts
+    USAGE_WORKERS = 16
+
+    # Shared across instances: mount topology rarely changes
+    _partitions: Optional[list] = None
+    _partitions_time = 0.0
+    _executor: Optional[ThreadPoolExecutor] = None
+
+    # Mountpoint -> statvfs call still running in the pool. A mount that hangs
+    # (e.g. a stale NFS mount) keeps its worker busy, so it is waited on
+    # again rather than resubmitted and allowed to fill up the pool.
+    _in_flight: Dict[str, Future] = {}
+    _in_flight_lock = threading.Lock()
+
+    @classmethod
+    def _get_partitions(cls) -> list:
+        """Get mounted partitions, re-reading them at most every PARTITIONS_TTL seconds."""
+        now = time.monotonic()
+        if cls._partitions is None or now - cls._partitions_time >= cls.PARTITIONS_TTL:
+            cls._partitions = psutil.disk_partitions(all=False)
+            cls._partitions_time = now
+        return cls._partitions
+
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        """Get the shared pool used to query mounts concurrently."""
+        if cls._executor is None:
+            cls._executor = ThreadPoolExecutor(
+                max_workers=cls.USAGE_WORKERS,
+                thread_name_prefix='disk-usage',
+            )
+        return cls._executor
+
+    @classmethod
+    def _submit_usage(cls, mountpoint: str) -> Future:
+        """Query a mount in the pool, reusing its call if one is still running."""
+        with cls._in_flight_lock:
+            future = cls._in_flight.get(mountpoint)
+            if future is not None:
+                return future
+            future = cls._get_executor().submit(_disk_usage, mountpoint)
+            cls._in_flight[mountpoint] = future
+        # Outside the lock: the callback runs right away if the call already finished
+        future.add_done_callback(lambda done: cls._forget_usage(mountpoint, done))
+        return future
+
+    @classmethod
+    def _forget_usage(cls, mountpoint: str, future: Future):
+        """Drop a finished statvfs call from the in-flight map."""
+        with cls._in_flight_lock:
+            if cls._in_flight.get(mountpoint) is future:
+                del cls._in_flight[mountpoint]
 
     @property
     def name(self) -> str:
@@ -45,16 +158,17 @@ class DiskUsageCheck(BaseCheck):
         Returns:
             CheckResult with disk usage information
         """
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
 
-        warning_threshold = self.config.get('warning_threshold', self.DEFAULT_WARNING_THRESHOLD)
-        critical_threshold = self.config.get('critical_threshold', self.DEFAULT_CRITICAL_THRESHOLD)
-        paths = self.config.get('paths', [])
-        exclude_types = self.config.get('exclude_types', self.DEFAULT_EXCLUDE_TYPES)
+        cfg_get = self.config.get
+        warning_threshold = cfg_get('warning_threshold', self.DEFAULT_WARNING_THRESHOLD)
+        critical_threshold = cfg_get('critical_threshold', self.DEFAULT_CRITICAL_THRESHOLD)
+        paths = cfg_get('paths', [])
+        exclude_types = cfg_get('exclude_types', self.DEFAULT_EXCLUDE_TYPES)
 
         try:
             disk_info = self._get_disk_usage(paths, exclude_types)
-            duration = int((time.time() - start_time) * 1000)
+            duration = (time.monotonic_ns() - start_ns) // 1_000_000
 
             if not disk_info:
                 return CheckResult(
@@ -64,21 +178,29 @@ class DiskUsageCheck(BaseCheck):
                     duration=duration,
                 )
 
-            # Analyze results
-            max_usage = max(d['percent'] for d in disk_info)
-            critical_disks = [d for d in disk_info if d['percent'] >= critical_threshold]
-            warning_disks = [d for d in disk_info if warning_threshold <= d['percent'] < critical_threshold]
+            # Analyze results in a single pass
+            max_usage = disk_info[0].percent
+            critical_disks = []
+            warning_disks = []
+            for d in disk_info:
+                percent = d.percent
+                if percent > max_usage:
+                    max_usage = percent
+                if percent >= critical_threshold:
+                    critical_disks.append(d)
+                elif percent >= warning_threshold:
+                    warning_disks.append(d)
 
             # Determine status and score
             if critical_disks:
                 status = CheckStatus.CRITICAL
                 score = 30
-                disks_str = ', '.join(f"{d['mountpoint']} ({d['percent']:.1f}%)" for d in critical_disks)
+                disks_str = ', '.join(_DISK_MSG_FMT % (d.mountpoint, d.percent) for d in critical_disks)
                 message = f"Critical disk usage: {disks_str}"
             elif warning_disks:
                 status = CheckStatus.WARNING
                 score = 70
-                disks_str = ', '.join(f"{d['mountpoint']} ({d['percent']:.1f}%)" for d in warning_disks)
+                disks_str = ', '.join(_DISK_MSG_FMT % (d.mountpoint, d.percent) for d in warning_disks)
                 message = f"High disk usage: {disks_str}"
             else:
                 status = CheckStatus.PASSED
@@ -90,7 +212,7 @@ class DiskUsageCheck(BaseCheck):
                 score=score,
                 message=message,
                 details={
-                    'disks': disk_info,
+                    'disks': [d.to_dict() for d in disk_info],
                     'max_usage_percent': max_usage,
                     'warning_threshold': warning_threshold,
                     'critical_threshold': critical_threshold,
@@ -99,8 +221,8 @@ class DiskUsageCheck(BaseCheck):
             )
 
         except Exception as e:
-            duration = int((time.time() - start_time) * 1000)
-            logger.error(f"Disk check failed: {e}")
+            duration = (time.monotonic_ns() - start_ns) // 1_000_000
+            logger.error("Disk check failed: %s", e)
             return CheckResult(
                 status=CheckStatus.ERROR,
                 score=0,
@@ -108,11 +230,62 @@ class DiskUsageCheck(BaseCheck):
                 duration=duration,
             )
 
+    @classmethod
+    def read_usage(cls, targets: List[Tuple[str, str, str]]) -> List[DiskEntry]:
+        """
+        Get disk usage for mounts without letting a hung mount block the caller.
+
+        statvfs runs in the shared pool (it releases the GIL, so slow mounts
+        are queried in parallel) and all mounts together are waited on for
+        at most USAGE_TIMEOUT seconds. Mounts that time out or cannot be
+        accessed are logged and left out.
+
+        Args:
+            targets: (mountpoint, device, fstype) tuples to query
+
+        Returns:
+            List of DiskEntry tuples with raw byte counts
+        """
+        futures = [cls._submit_usage(target[0]) for target in targets]
+        deadline = time.monotonic() + cls.USAGE_TIMEOUT
+
+        disk_info = []
+        for future, (mountpoint, device, fstype) in zip(futures, targets):
+            try:
+                usage = future.result(timeout=max(0.0, deadline - time.monotonic()))
+            except FutureTimeoutError:
+                logger.warning("Timed out reading disk usage for %s", mountpoint)
+                continue
+            except (OSError, PermissionError) as e:
+                logger.warning("Cannot access %s: %s", mountpoint, e)
+                continue
+            disk_info.append(DiskEntry(mountpoint, device, fstype, *usage))
+
+        return disk_info
+
+    @classmethod
+    def partition_usage(cls, exclude_types: Iterable[str]) -> List[DiskEntry]:
+        """
+        Get disk usage for all mounted partitions, bounded by USAGE_TIMEOUT.
+
+        Args:
+            exclude_types: Filesystem types to exclude
+
+        Returns:
+            List of DiskEntry tuples with raw byte counts
+        """
+        exclude_types = frozenset(exclude_types)
+        return cls.read_usage([
+            (partition.mountpoint, partition.device, partition.fstype)
+            for partition in cls._get_partitions()
+            if partition.fstype not in exclude_types
+        ])
+
     def _get_disk_usage(
         self,
         paths: List[str],
         exclude_types: List[str],
-    ) -> List[Dict[str, Any]]:
+    ) -> List[DiskEntry]:
         """
         Get disk usage information.
 
@@ -121,50 +294,10 @@ class DiskUsageCheck(BaseCheck):
             exclude_types: Filesystem types to exclude
 
         Returns:
-            List of disk usage dictionaries
+            List of DiskEntry tuples with raw byte counts
         """
-        disk_info = []
-
         if paths:
             # Check specific paths
-            for path in paths:
-                try:
-                    usage = psutil.disk_usage(path)
-                    disk_info.append({
-                        'mountpoint': path,
-                        'device': 'N/A',
-                        'fstype': 'N/A',
-                        'total_bytes': usage.total,
-                        'used_bytes': usage.used,
-                        'free_bytes': usage.free,
-                        'percent': usage.percent,
-                        'total_gb': round(usage.total / (1024**3), 2),
-                        'used_gb': round(usage.used / (1024**3), 2),
-                        'free_gb': round(usage.free / (1024**3), 2),
-                    })
-                except (OSError, PermissionError) as e:
-                    logger.warning(f"Cannot access path {path}: {e}")
-        else:
-            # Check all mounted partitions
-            for partition in psutil.disk_partitions(all=False):
-                if partition.fstype in exclude_types:
-                    continue
-
-                try:
-                    usage = psutil.disk_usage(partition.mountpoint)
-                    disk_info.append({
-                        'mountpoint': partition.mountpoint,
-                        'device': partition.device,
-                        'fstype': partition.fstype,
-                        'total_bytes': usage.total,
-                        'used_bytes': usage.used,
-                        'free_bytes': usage.free,
-                        'percent': usage.percent,
-                        'total_gb': round(usage.total / (1024**3), 2),
-                        'used_gb': round(usage.used / (1024**3), 2),
-                        'free_gb': round(usage.free / (1024**3), 2),
-                    })
-                except (OSError, PermissionError) as e:
-                    logger.warning(f"Cannot access {partition.mountpoint}: {e}")
-
-        return disk_info
+            return self.read_usage([(path, 'N/A', 'N/A') for path in paths])
+        # Check all mounted partitions
+        return self.partition_usage(exclude_types)
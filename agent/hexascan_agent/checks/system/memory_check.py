@@ -10,9 +10,18 @@ import psutil
 
 from ..base import BaseCheck, CheckResult, CheckStatus
 from ..registry import CheckRegistry
+from .sampler import SystemSampler
 
 logger = logging.getLogger(__name__)
 
+# Bytes to GB; 2**-30 is exact, so multiplying matches dividing bit for bit
+_GB_INV = 1.0 / (1 << 30)
+
+# Platform-specific virtual_memory() fields, probed once
+_MEM_FIELDS = psutil.virtual_memory()._fields
+_HAS_BUFFERS = 'buffers' in _MEM_FIELDS
+_HAS_CACHED = 'cached' in _MEM_FIELDS
+
 
 @CheckRegistry.register('MEMORY_USAGE')
 class MemoryUsageCheck(BaseCheck):
@@ -43,15 +52,16 @@ class MemoryUsageCheck(BaseCheck):
         Returns:
             CheckResult with memory usage information
         """
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
 
-        warning_threshold = self.config.get('warning_threshold', self.DEFAULT_WARNING_THRESHOLD)
-        critical_threshold = self.config.get('critical_threshold', self.DEFAULT_CRITICAL_THRESHOLD)
-        include_swap = self.config.get('include_swap', True)
+        cfg_get = self.config.get
+        warning_threshold = cfg_get('warning_threshold', self.DEFAULT_WARNING_THRESHOLD)
+        critical_threshold = cfg_get('critical_threshold', self.DEFAULT_CRITICAL_THRESHOLD)
+        include_swap = cfg_get('include_swap', True)
 
         try:
             memory_info = self._get_memory_usage(include_swap)
-            duration = int((time.time() - start_time) * 1000)
+            duration = (time.monotonic_ns() - start_ns) // 1_000_000
 
             memory_percent = memory_info['percent']
 
@@ -89,8 +99,8 @@ class MemoryUsageCheck(BaseCheck):
             )
 
         except Exception as e:
-            duration = int((time.time() - start_time) * 1000)
-            logger.error(f"Memory check failed: {e}")
+            duration = (time.monotonic_ns() - start_ns) // 1_000_000
+            logger.error("Memory check failed: %s", e)
             return CheckResult(
                 status=CheckStatus.ERROR,
                 score=0,
@@ -108,38 +118,37 @@ class MemoryUsageCheck(BaseCheck):
         Returns:
             Dictionary with memory usage information
         """
-        # Get virtual memory
-        mem = psutil.virtual_memory()
+        # Read memory and swap back to back so both describe the same moment
+        mem, swap = SystemSampler.memory(include_swap)
 
         memory_info = {
             'percent': mem.percent,
             'total_bytes': mem.total,
             'available_bytes': mem.available,
             'used_bytes': mem.used,
-            'total_gb': round(mem.total / (1024**3), 2),
-            'available_gb': round(mem.available / (1024**3), 2),
-            'used_gb': round(mem.used / (1024**3), 2),
+            'total_gb': round(mem.total * _GB_INV, 2),
+            'available_gb': round(mem.available * _GB_INV, 2),
+            'used_gb': round(mem.used * _GB_INV, 2),
         }
 
         # Add platform-specific memory details
-        if hasattr(mem, 'buffers'):
+        if _HAS_BUFFERS:
             memory_info['buffers_bytes'] = mem.buffers
-            memory_info['buffers_gb'] = round(mem.buffers / (1024**3), 2)
-        if hasattr(mem, 'cached'):
+            memory_info['buffers_gb'] = round(mem.buffers * _GB_INV, 2)
+        if _HAS_CACHED:
             memory_info['cached_bytes'] = mem.cached
-            memory_info['cached_gb'] = round(mem.cached / (1024**3), 2)
+            memory_info['cached_gb'] = round(mem.cached * _GB_INV, 2)
 
         # Get swap memory if requested
-        if include_swap:
-            swap = psutil.swap_memory()
+        if swap is not None:
             memory_info['swap'] = {
                 'total_bytes': swap.total,
                 'used_bytes': swap.used,
                 'free_bytes': swap.free,
                 'percent': swap.percent,
-                'total_gb': round(swap.total / (1024**3), 2),
-                'used_gb': round(swap.used / (1024**3), 2),
-                'free_gb': round(swap.free / (1024**3), 2),
+                'total_gb': round(swap.total * _GB_INV, 2),
+                'used_gb': round(swap.used * _GB_INV, 2),
+                'free_gb': round(swap.free * _GB_INV, 2),
             }
 
         return memory_info
@@ -0,0 +1,170 @@
+"""
+Shared system readings for the system checks.
+
+CPU, memory, and system health checks all read the same counters. Routing
+them through SystemSampler lets one psutil read feed every check that asks
+within a short window, and keeps CPU usage deltas independent of the thread
+a check happens to run on.
+"""
+
+import threading
+import time
+from typing import Any, List, NamedTuple, Optional, Tuple
+
+import psutil
+
+
+class CpuSample(NamedTuple):
+    """CPU usage measured between two cpu_times() snapshots."""
+    percent: float
+    per_cpu: List[float]
+    taken_at: float  # time.monotonic() of the closing snapshot
+
+
+def _busy_percent(before: Any, after: Any) -> float:
+    """
+    Calculate CPU busy percentage between two cpu_times() tuples.
+
+    Mirrors psutil.cpu_percent(): guest time is already counted in user and
+    nice on Linux, and iowait counts as idle.
+
+    Args:
+        before: Earlier cpu_times() tuple
+        after: Later cpu_times() tuple
+
+    Returns:
+        Busy percentage rounded to one decimal
+    """
+    deltas = dict(zip(after._fields, (max(0, b - a) for a, b in zip(before, after))))
+    total = sum(deltas.values()) - deltas.get('guest', 0) - deltas.get('guest_nice', 0)
+    if total <= 0:
+        return 0.0
+    busy = total - deltas['idle'] - deltas.get('iowait', 0)
+    return round(min(100.0, max(0.0, busy / total * 100)), 1)
+
+
+class SystemSampler:
+    """
+    Process-wide owner of CPU and memory readings.
+
+    CPU usage is the delta between consecutive cpu_times() snapshots kept
+    here, rather than psutil's own per-thread baseline, so checks running on
+    pooled task threads share one baseline. Memory readings are reused for
+    up to MEMORY_MAX_AGE seconds.
+    """
+
+    MEMORY_MAX_AGE = 1.0
+
+    _lock = threading.Lock()
+
+    _cpu_times: Any = None
+    _per_cpu_times: Optional[list] = None
+    _cpu_times_at = 0.0
+    _cpu_sample: Optional[CpuSample] = None
+
+    _memory: Any = None
+    _memory_at = 0.0
+    _swap: Any = None
+    _swap_at = 0.0
+
+    @classmethod
+    def prime(cls):
+        """
+        Take the baseline CPU snapshots so later samples return immediately.
+
+        Also primes per-process CPU accounting: psutil.process_iter() reuses
+        Process objects, so the first real process listing reports usage
+        since now instead of 0.0 for every process.
+
+        Called once at agent startup.
+        """
+        with cls._lock:
+            cls._snapshot_cpu()
+            cls._cpu_sample = None
+        for _ in psutil.process_iter(['cpu_percent']):
+            pass
+
+    @classmethod
+    def cpu_sample(cls, min_window: float, max_age: float) -> CpuSample:
+        """
+        Get CPU usage, measuring over at least min_window seconds.
+
+        A sample taken less than max_age seconds ago is returned as is.
+        Only when the baseline is younger than min_window does this block,
+        for the remainder of the window. The lock is released while waiting,
+        so memory readings are not held up by a cold CPU sample.
+
+        Args:
+            min_window: Minimum measurement window in seconds
+            max_age: Maximum age of a reusable sample in seconds
+
+        Returns:
+            CpuSample with overall and per-CPU percentages
+        """
+        while True:
+            with cls._lock:
+                if cls._cpu_times is None:
+                    cls._snapshot_cpu()
+
+                sample = cls._cpu_sample
+                if sample is not None and time.monotonic() - sample.taken_at < max_age:
+                    return sample
+
+                remaining = min_window - (time.monotonic() - cls._cpu_times_at)
+                if remaining <= 0:
+                    before, per_cpu_before = cls._cpu_times, cls._per_cpu_times
+                    cls._snapshot_cpu()
+                    sample = CpuSample(
+                        percent=_busy_percent(before, cls._cpu_times),
+                        per_cpu=[
+                            _busy_percent(b, a)
+                            for b, a in zip(per_cpu_before, cls._per_cpu_times)
+                        ],
+                        taken_at=cls._cpu_times_at,
+                    )
+                    cls._cpu_sample = sample
+                    return sample
+
+            # Wait outside the lock, then re-check: another thread may have
+            # taken the sample in the meantime
+            time.sleep(remaining)
+
+    @classmethod
+    def virtual_memory(cls) -> Any:
+        """Get psutil.virtual_memory(), reused for up to MEMORY_MAX_AGE seconds."""
+        with cls._lock:
+            now = time.monotonic()
+            if cls._memory is None or now - cls._memory_at >= cls.MEMORY_MAX_AGE:
+                cls._memory = psutil.virtual_memory()
+                cls._memory_at = now
+            return cls._memory
+
+    @classmethod
+    def swap_memory(cls) -> Any:
+        """Get psutil.swap_memory(), reused for up to MEMORY_MAX_AGE seconds."""
+        with cls._lock:
+            now = time.monotonic()
+            if cls._swap is None or now - cls._swap_at >= cls.MEMORY_MAX_AGE:
+                cls._swap = psutil.swap_memory()
+                cls._swap_at = now
+            return cls._swap
+
+    @classmethod
+    def memory(cls, include_swap: bool = True) -> Tuple[Any, Any]:
+        """
+        Get virtual memory and, optionally, swap read back to back.
+
+        Args:
+            include_swap: Whether to read swap as well
+
+        Returns:
+            Tuple of (virtual memory, swap memory or None)
+        """
+        return cls.virtual_memory(), cls.swap_memory() if include_swap else None
+
+    @classmethod
+    def _snapshot_cpu(cls):
+        """Record overall and per-CPU times as the new baseline. Caller holds the lock."""
+        cls._cpu_times = psutil.cpu_times()
+        cls._per_cpu_times = psutil.cpu_times(percpu=True)
+        cls._cpu_times_at = time.monotonic()
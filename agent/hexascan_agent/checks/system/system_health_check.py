@@ -3,17 +3,44 @@ Combined System Health check implementation.
 
 Checks CPU, Memory, Disk, and important service status in a single unified check.
 Also includes top processes by CPU and Memory usage.
+
+Performance model:
+    This check is bound by I/O and subprocess calls, not by computation. Its
+    own CPU time goes to parsing systemctl output and building dicts, so
+    vectorised or compiled number crunching has nothing to speed up here.
+    The techniques that pay off are:
+
+    - Concurrency: collectors run in parallel on a shared pool
+      (SystemHealthCheck._get_executor).
+    - Fewer subprocesses: one list-units, one list-unit-files and batched
+      `systemctl show` calls instead of one call per service.
+    - Caching: service status is reused for SERVICES_TTL seconds and whole
+      results for min_interval seconds (see BaseCheck).
+    - Smaller data: parsed rows are NamedTuples until serialization, and CPU
+      and memory readings come from the shared SystemSampler instead of
+      fresh psutil calls.
 """
 
+import heapq
 import logging
+import os
+import re
+import shlex
+import shutil
+import socket
+import struct
 import subprocess
 import time
-from typing import Dict, Any, List, Optional
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from operator import attrgetter
+from typing import Callable, Dict, Any, FrozenSet, List, NamedTuple, Optional, Tuple
 
 import psutil
 
 from ..base import BaseCheck, CheckResult, CheckStatus
 from ..registry import CheckRegistry
+from .disk_check import DiskUsageCheck
+from .sampler import SystemSampler
 
 logger = logging.getLogger(__name__)
 
@@ -42,14 +69,328 @@ EXCLUSIVE_SERVICE_GROUPS = [
     ['crond', 'cron'],  # Cron - package name varies by distro
 ]
 
+# Service name -> its exclusive group, for O(1) lookups
+_SERVICE_TO_GROUP = {service: group for group in EXCLUSIVE_SERVICE_GROUPS for service in group}
+
+# One `systemctl list-units` row: optional failed-unit bullet, then UNIT LOAD ACTIVE SUB
+_UNIT_LINE_RE = re.compile(
+    r'[\s●*]*(?P<unit>(?P<name>\S+?)\.service)\s+(?P<load>\S+)\s+(?P<active>\S+)\s+(?P<sub>\S+)'
+)
+
+# CPU counts never change while the agent runs
+_CPU_COUNT_PHYSICAL = psutil.cpu_count(logical=False) or 1
+_CPU_COUNT_LOGICAL = psutil.cpu_count(logical=True) or 1
+
+# os.getloadavg() is what psutil.getloadavg() wraps on POSIX; psutil keeps an
+# emulated version for Windows
+_getloadavg = getattr(os, 'getloadavg', None) or psutil.getloadavg
+
+# Firewall tools, in the order _get_firewall_status() tries them
+_FIREWALL_TOOLS = ('ufw', 'firewall-cmd', 'iptables')
+
+# firewall-cmd queries made once firewalld is known to be running
+_FIREWALLD_QUERIES = ('--get-active-zones', '--list-services', '--list-ports')
+
+# Non-blank `ufw status` rule line, without surrounding whitespace
+_UFW_RULE_RE = re.compile(r'^[^\S\n]*(\S.*?)[^\S\n]*$', re.M)
+
+# Non-empty `iptables -L` line that is not a chain or column header
+_IPTABLES_RULE_RE = re.compile(r'^(?!Chain|num)(?=.)', re.M)
+
+# Marker line ending each command's output in _run_batched()
+_BATCH_MARKER = '--- hexascan exit status'
+_BATCH_SPLIT_RE = re.compile(rf'^{_BATCH_MARKER} (\d+)\n?', re.M)
+
+# One `ss -tuln` row: Netid State Recv-Q Send-Q Local:Port; the address keeps
+# IPv6 brackets and interface suffixes, the port is the last colon field
+_SS_LISTEN_RE = re.compile(
+    r'^(?P<netid>\S+)\s+\S+\s+\S+\s+\S+\s+(?P<addr>\S+):(?P<port>\d+)\s', re.M
+)
+
+# /proc/net socket tables, their hex address width, and the state ss -l lists
+# for each: TCP_LISTEN for TCP, TCP_CLOSE (shown as UNCONN) for unconnected UDP
+_PROC_NET_TABLES = (
+    ('tcp', 'tcp', 8, b'0A'),
+    ('tcp6', 'tcp', 32, b'0A'),
+    ('udp', 'udp', 8, b'07'),
+    ('udp6', 'udp', 32, b'07'),
+)
+
+# Well-known risky ports that shouldn't be publicly exposed
+_RISKY_PORTS = {
+    21: 'FTP',
+    22: 'SSH',
+    23: 'Telnet',
+    25: 'SMTP',
+    135: 'MSRPC',
+    137: 'NetBIOS',
+    138: 'NetBIOS',
+    139: 'NetBIOS',
+    445: 'SMB',
+    1433: 'MSSQL',
+    1434: 'MSSQL',
+    3306: 'MySQL',
+    3389: 'RDP',
+    5432: 'PostgreSQL',
+    5900: 'VNC',
+    6379: 'Redis',
+    11211: 'Memcached',
+    27017: 'MongoDB',
+}
+
+# Ports that are typically safe to expose
+_SAFE_PUBLIC_PORTS = frozenset({80, 443, 8080, 8443})
+
+# Risky ports whose public exposure is high rather than medium risk
+_HIGH_RISK_PORTS = frozenset({23, 3389, 5900, 6379, 11211, 27017})
+
+# Service names for other well-known ports
+_COMMON_PORTS = {
+    80: 'HTTP',
+    443: 'HTTPS',
+    8080: 'HTTP-ALT',
+    8443: 'HTTPS-ALT',
+    53: 'DNS',
+    110: 'POP3',
+    143: 'IMAP',
+    993: 'IMAPS',
+    995: 'POP3S',
+    587: 'SMTP-MSA',
+    465: 'SMTPS',
+    9200: 'Elasticsearch',
+    9300: 'Elasticsearch',
+    9000: 'PHP-FPM',
+    15672: 'RabbitMQ',
+    5672: 'AMQP',
+}
+
+# Port -> service name for every port above; risky names take precedence
+_PORT_SERVICES = {**_COMMON_PORTS, **_RISKY_PORTS}
+
+# Bytes to GB; 2**-30 is exact, so multiplying matches dividing bit for bit
+_GB_INV = 1.0 / (1 << 30)
+
+_BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+
+class _ServiceStatus(NamedTuple):
+    """One parsed systemd service; rank orders running services first."""
+    rank: int
+    name: str
+    is_running: bool
+    is_enabled: bool
+    status: str  # sub-state: running, exited, dead, failed
+    active_state: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert entry to dictionary for the check details."""
+        return {
+            'name': self.name,
+            'is_running': self.is_running,
+            'is_enabled': self.is_enabled,
+            'status': self.status,
+            'active_state': self.active_state,
+        }
+
+
+class _ProcessRow(NamedTuple):
+    """One process from the process table; only the top entries become dicts."""
+    pid: int
+    name: str
+    user: str
+    cpu_percent: float
+    memory_percent: float
+    cmdline: Optional[List[str]]  # joined only if the row is selected
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert entry to dictionary for the check details."""
+        # Command line, truncated if too long
+        command = _bounded_join(self.cmdline, 200) if self.cmdline else self.name
+        return {
+            'pid': self.pid,
+            'name': self.name,
+            'user': self.user,
+            'cpu_percent': self.cpu_percent,
+            'memory_percent': self.memory_percent,
+            'command': command,
+        }
+
+
+# Marks a collector without a timeout placeholder
+_REQUIRED = object()
+
+
+def _parse_show_output(output: str) -> List[Dict[str, str]]:
+    """
+    Parse `systemctl show` output into one property dict per unit.
+
+    Units are separated by blank lines, in the order they were requested.
+
+    Args:
+        output: stdout of systemctl show
+
+    Returns:
+        List of KEY=VALUE property dictionaries (at least one)
+    """
+    blocks = [{}]
+    for line in output.splitlines():
+        if not line:
+            if blocks[-1]:
+                blocks.append({})
+            continue
+        if '=' in line:
+            key, value = line.split('=', 1)
+            blocks[-1][key] = value
+    if len(blocks) > 1 and not blocks[-1]:
+        blocks.pop()
+    return blocks
+
+
+def _bounded_join(parts: List[str], limit: int) -> str:
+    """
+    Join parts with spaces, truncating to limit characters with '...'.
+
+    Same result as truncating the full join, but stops at the first part that
+    crosses the limit instead of joining every argument of a long command.
+
+    Args:
+        parts: Strings to join
+        limit: Maximum length of the result
+
+    Returns:
+        Joined string, at most limit characters long
+    """
+    length = -1
+    for i, part in enumerate(parts):
+        length += len(part) + 1
+        if length > limit:
+            return ' '.join(parts[:i + 1])[:limit - 3] + '...'
+    return ' '.join(parts)
+
+
+def _format_proc_address(hex_address: bytes) -> str:
+    """
+    Format a /proc/net socket address the way ss prints it.
+
+    The kernel writes the address as 32-bit words in host byte order.
+
+    Args:
+        hex_address: Hex address field, 8 digits for IPv4 or 32 for IPv6
+
+    Returns:
+        Dotted IPv4 address, or bracketed IPv6 address
+    """
+    packed = b''.join(
+        struct.pack('=I', int(hex_address[i:i + 8], 16))
+        for i in range(0, len(hex_address), 8)
+    )
+    if len(packed) == 4:
+        return socket.inet_ntop(socket.AF_INET, packed)
+    return f'[{socket.inet_ntop(socket.AF_INET6, packed)}]'
+
+
+def _read_proc_listeners() -> Optional[List[Tuple[str, str, int]]]:
+    """
+    Read listening sockets straight from the kernel's /proc/net tables.
+
+    After the variable-width slot number, every row has a fixed layout:
+    "LOCAL:PORT REMOTE:PORT ST" with addresses of a known width, so fields
+    are sliced out by offset instead of splitting the line.
+
+    Returns:
+        List of (protocol, address, port) tuples, or None if /proc/net is
+        not available (non-Linux systems)
+    """
+    listeners = []
+    for table, protocol, width, state in _PROC_NET_TABLES:
+        port_at = width + 1
+        state_at = 2 * width + 12
+        try:
+            with open(f'/proc/net/{table}', 'rb') as f:
+                lines = f.read().splitlines()[1:]  # Skip header
+        except FileNotFoundError:
+            if table.endswith('6'):
+                continue  # IPv6 disabled
+            return None
+        for line in lines:
+            start = line.find(b': ') + 2  # Past "  sl: "
+            if line[start + state_at:start + state_at + 2] != state:
+                continue
+            listeners.append((
+                protocol,
+                _format_proc_address(line[start:start + width]),
+                int(line[start + port_at:start + port_at + 4], 16),
+            ))
+    return listeners
+
+
+def _run_command(args: List[str], timeout: float = 10) -> Optional[subprocess.CompletedProcess]:
+    """
+    Run an external tool, capturing its output as text.
+
+    A missing executable still raises FileNotFoundError so callers can move
+    on to the next tool; a timeout is logged and reported as None.
+
+    Args:
+        args: Command and arguments
+        timeout: Timeout in seconds
+
+    Returns:
+        Completed process, or None if the command timed out
+    """
+    try:
+        return subprocess.run(
+            args,
+            capture_output=True,
+            encoding='utf-8',
+            errors='replace',
+            timeout=timeout
+        )
+    except subprocess.TimeoutExpired:
+        logger.debug(f"{args[0]} timed out after {timeout}s")
+        return None
+
+
+def _run_batched(commands: List[List[str]], timeout: float) -> List[Optional[str]]:
+    """
+    Run several commands in a single shell and split their output.
+
+    Each command's stdout is followed by a marker line carrying its exit
+    status, so one process spawn replaces one per command while keeping
+    per-command results.
+
+    Args:
+        commands: Commands to run, in order
+        timeout: Timeout for the whole batch in seconds
+
+    Returns:
+        Stdout of each command, or None where the command failed
+    """
+    script = '; '.join(
+        f'{shlex.join(command)}; rc=$?; echo; echo "{_BATCH_MARKER} $rc"'
+        for command in commands
+    )
+    result = _run_command(['sh', '-c', script], timeout=timeout)
+    if result is None:
+        return [None] * len(commands)
+    # [stdout, status, stdout, status, ..., trailing text]
+    sections = _BATCH_SPLIT_RE.split(result.stdout)
+    outputs: List[Optional[str]] = []
+    for i in range(len(commands)):
+        if 2 * i + 1 < len(sections) and sections[2 * i + 1] == '0':
+            outputs.append(sections[2 * i])
+        else:
+            outputs.append(None)
+    return outputs
+
 
 def format_bytes(bytes_value: int) -> str:
     """Format bytes to human-readable string."""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes_value < 1024:
-            return f"{bytes_value:.2f} {unit}"
-        bytes_value /= 1024
-    return f"{bytes_value:.2f} PB"
+    if bytes_value < 1024:
+        return f"{bytes_value:.2f} B"
+    # Each unit is 2**10 of the previous one, so the bit length picks it directly
+    idx = min(len(_BYTE_UNITS) - 1, (int(bytes_value).bit_length() - 1) // 10)
+    return f"{bytes_value / (1 << (10 * idx)):.2f} {_BYTE_UNITS[idx]}"
 
 
 @CheckRegistry.register('SYSTEM_HEALTH')
@@ -71,6 +412,8 @@ class SystemHealthCheck(BaseCheck):
         critical_services: Services that trigger critical status if down (default: ['httpd', 'apache2', 'nginx', 'mysqld', 'mariadb'])
         include_firewall: Include firewall status check (default: True)
         include_open_ports: Include open ports security check (default: True)
+        min_interval: Seconds to serve the previous result to identical
+            requests instead of re-running every collector (default: 5)
     """
 
     DEFAULT_CPU_WARNING = 80
@@ -82,6 +425,44 @@ class SystemHealthCheck(BaseCheck):
     DEFAULT_EXCLUDE_TYPES = ['tmpfs', 'devtmpfs', 'squashfs', 'overlay']
     DEFAULT_PROCESS_COUNT = 25
     DEFAULT_CRITICAL_SERVICES = ['httpd', 'apache2', 'nginx', 'mysqld', 'mariadb', 'mysql']
+    DEFAULT_MIN_INTERVAL = 5
+    CPU_MIN_WINDOW = 0.1  # Seconds; shortest CPU measurement window on a cold start
+    CPU_MAX_AGE = 1  # Seconds to reuse a CPU sample taken by another check
+    COLLECTOR_WORKERS = 7  # One per metric collector
+    COLLECTOR_TIMEOUT = 60  # Seconds to wait for all collectors
+    SERVICES_TTL = 30  # Seconds to reuse the systemd service listing
+    SECURITY_PROBE_TTL = 60  # Seconds to reuse firewall and open port results
+
+    # Shared across instances, created on first use
+    _executor: Optional[ThreadPoolExecutor] = None
+    # (monotonic timestamp, critical services, result) of the last service listing
+    _services_cache: Optional[Tuple[float, Tuple[str, ...], Dict[str, Any]]] = None
+    # Probe name -> (monotonic timestamp, result) of the last firewall/port probe
+    _probe_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+    # Installed firewall tools, found on first use
+    _firewall_tools: Optional[FrozenSet[str]] = None
+
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        """Get the shared pool used to run metric collectors concurrently."""
+        if cls._executor is None:
+            cls._executor = ThreadPoolExecutor(
+                max_workers=cls.COLLECTOR_WORKERS,
+                thread_name_prefix='system-health',
+            )
+        return cls._executor
+
+    @classmethod
+    def invalidate(cls):
+        """Drop cached service, firewall and port results so the next check re-probes."""
+        cls._services_cache = None
+        cls._probe_cache.clear()
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """Initialize the system health check."""
+        super().__init__(config)
+        # Lowercased process names, built on first use by _get_process_names()
+        self._process_names: Optional[FrozenSet[str]] = None
 
     @property
     def name(self) -> str:
@@ -116,18 +497,37 @@ class SystemHealthCheck(BaseCheck):
             include_firewall = self.config.get('include_firewall', True)
             include_open_ports = self.config.get('include_open_ports', True)
 
-            # Collect all metrics
-            cpu_data = self._get_cpu_info(cpu_warning, cpu_critical)
-            memory_data = self._get_memory_info(memory_warning, memory_critical)
-            disk_data = self._get_disk_info(disk_warning, disk_critical, disk_exclude_types)
+            # Run all collectors concurrently; they mostly wait on syscalls and subprocesses
+            executor = self._get_executor()
+            cpu_future = executor.submit(self._get_cpu_info, cpu_warning, cpu_critical)
+            memory_future = executor.submit(self._get_memory_info, memory_warning, memory_critical)
+            disk_future = executor.submit(self._get_disk_info, disk_warning, disk_critical, disk_exclude_types)
 
-            # Collect optional metrics - services now includes ALL installed services
-            services_data = self._get_services_status([], critical_services) if include_services else None
-            processes_data = self._get_top_processes(process_count) if include_processes else None
+            # Optional metrics - services now includes ALL installed services
+            services_future = executor.submit(self._get_services_status, [], critical_services) if include_services else None
+            processes_future = executor.submit(self._get_top_processes, process_count) if include_processes else None
 
-            # Collect security-related metrics
-            firewall_data = self._get_firewall_status() if include_firewall else None
-            open_ports_data = self._get_open_ports() if include_open_ports else None
+            # Security-related metrics
+            firewall_future = (
+                executor.submit(self._cached_probe, 'firewall', self._get_firewall_status)
+                if include_firewall else None
+            )
+            open_ports_future = (
+                executor.submit(self._cached_probe, 'open_ports', self._get_open_ports)
+                if include_open_ports else None
+            )
+
+            deadline = time.monotonic() + self.COLLECTOR_TIMEOUT
+            cpu_data = self._collect(cpu_future, deadline, 'cpu')
+            memory_data = self._collect(memory_future, deadline, 'memory')
+            disk_data = self._collect(disk_future, deadline, 'disk')
+            services_data = self._collect(
+                services_future, deadline, 'services',
+                {'services': [], 'total': 0, 'status': 'passed', 'score': 100, 'error': 'timeout'},
+            )
+            processes_data = self._collect(processes_future, deadline, 'processes', None)
+            firewall_data = self._collect(firewall_future, deadline, 'firewall', None)
+            open_ports_data = self._collect(open_ports_future, deadline, 'open_ports', {'ports': [], 'error': 'timeout'})
 
             duration = int((time.time() - start_time) * 1000)
 
@@ -224,70 +624,95 @@ class SystemHealthCheck(BaseCheck):
                 duration=duration,
             )
 
+    def _collect(self, future: Optional[Future], deadline: float, name: str, fallback: Any = _REQUIRED) -> Any:
+        """
+        Wait for a collector until the shared deadline.
+
+        Args:
+            future: Collector future, or None if the collector is disabled
+            deadline: time.monotonic() value by which all collectors must finish
+            name: Collector name for logging
+            fallback: Placeholder returned on timeout; required collectors raise instead
+
+        Returns:
+            Collector result, the fallback on timeout, or None if disabled
+        """
+        if future is None:
+            return None
+        try:
+            return future.result(timeout=max(0.0, deadline - time.monotonic()))
+        except FutureTimeoutError:
+            logger.warning(f"System health collector '{name}' timed out")
+            if fallback is _REQUIRED:
+                raise TimeoutError(f"{name} metrics timed out")
+            return fallback
+
+    @staticmethod
+    def _tier(percent: float, warning_threshold: float, critical_threshold: float) -> Tuple[str, int]:
+        """
+        Map a usage percentage to its (status, score) tier.
+
+        Args:
+            percent: Usage percentage
+            warning_threshold: Percentage at which usage is a warning
+            critical_threshold: Percentage at which usage is critical
+
+        Returns:
+            Tuple of (status, score)
+        """
+        if percent >= critical_threshold:
+            return 'critical', 30
+        if percent >= warning_threshold:
+            return 'warning', 70
+        return 'passed', 100
+
     def _get_cpu_info(self, warning_threshold: int, critical_threshold: int) -> Dict[str, Any]:
         """Get CPU usage information."""
-        # Get CPU percentage (average over 1 second)
-        cpu_percent = psutil.cpu_percent(interval=1)
+        # Get CPU percentage: usage since the previous sample, which never blocks once
+        # the sampler is primed; a cold start waits out CPU_MIN_WINDOW at most
+        cpu_percent = SystemSampler.cpu_sample(
+            min_window=self.CPU_MIN_WINDOW,
+            max_age=self.CPU_MAX_AGE,
+        ).percent
 
         # Get load averages (1, 5, 15 minutes)
         try:
-            load_avg = psutil.getloadavg()
+            load_avg = _getloadavg()
         except (AttributeError, OSError):
-            # Windows doesn't support getloadavg
+            # Platform can't report load averages
             load_avg = (0, 0, 0)
 
-        # Get CPU count
-        cpu_count = psutil.cpu_count()
-        cpu_count_logical = psutil.cpu_count(logical=True)
-
         # Determine status
-        if cpu_percent >= critical_threshold:
-            status = 'critical'
-            score = 30
-        elif cpu_percent >= warning_threshold:
-            status = 'warning'
-            score = 70
-        else:
-            status = 'passed'
-            score = 100
+        status, score = self._tier(cpu_percent, warning_threshold, critical_threshold)
 
         return {
             'percent': cpu_percent,
             'load_avg_1m': load_avg[0],
             'load_avg_5m': load_avg[1],
             'load_avg_15m': load_avg[2],
-            'cores_physical': cpu_count,
-            'cores_logical': cpu_count_logical,
+            'cores_physical': _CPU_COUNT_PHYSICAL,
+            'cores_logical': _CPU_COUNT_LOGICAL,
             'status': status,
             'score': score,
         }
 
     def _get_memory_info(self, warning_threshold: int, critical_threshold: int) -> Dict[str, Any]:
         """Get memory usage information."""
-        memory = psutil.virtual_memory()
-        swap = psutil.swap_memory()
+        memory, swap = SystemSampler.memory()
 
         memory_percent = memory.percent
 
         # Determine status
-        if memory_percent >= critical_threshold:
-            status = 'critical'
-            score = 30
-        elif memory_percent >= warning_threshold:
-            status = 'warning'
-            score = 70
-        else:
-            status = 'passed'
-            score = 100
+        status, score = self._tier(memory_percent, warning_threshold, critical_threshold)
 
         return {
             'percent': memory_percent,
-            'total_gb': round(memory.total / (1024**3), 2),
-            'used_gb': round(memory.used / (1024**3), 2),
-            'available_gb': round(memory.available / (1024**3), 2),
+            'total_gb': round(memory.total * _GB_INV, 2),
+            'used_gb': round(memory.used * _GB_INV, 2),
+            'available_gb': round(memory.available * _GB_INV, 2),
             'swap_percent': swap.percent,
-            'swap_total_gb': round(swap.total / (1024**3), 2),
-            'swap_used_gb': round(swap.used / (1024**3), 2),
+            'swap_total_gb': round(swap.total * _GB_INV, 2),
+            'swap_used_gb': round(swap.used * _GB_INV, 2),
             'status': status,
             'score': score,
         }
@@ -304,43 +729,30 @@ class SystemHealthCheck(BaseCheck):
         worst_status = 'passed'
         worst_score = 100
 
-        for partition in psutil.disk_partitions(all=False):
-            if partition.fstype in exclude_types:
-                continue
-
-            try:
-                usage = psutil.disk_usage(partition.mountpoint)
-                percent = usage.percent
-
-                # Determine status for this disk
-                if percent >= critical_threshold:
-                    disk_status = 'critical'
-                    disk_score = 30
-                elif percent >= warning_threshold:
-                    disk_status = 'warning'
-                    disk_score = 70
-                else:
-                    disk_status = 'passed'
-                    disk_score = 100
-
-                # Track worst
-                if percent > max_percent:
-                    max_percent = percent
-                    worst_status = disk_status
-                    worst_score = disk_score
-
-                disks.append({
-                    'mountpoint': partition.mountpoint,
-                    'device': partition.device,
-                    'fstype': partition.fstype,
-                    'percent': percent,
-                    'total_gb': round(usage.total / (1024**3), 2),
-                    'used_gb': round(usage.used / (1024**3), 2),
-                    'free_gb': round(usage.free / (1024**3), 2),
-                    'status': disk_status,
-                })
-            except (OSError, PermissionError) as e:
-                logger.warning(f"Cannot access {partition.mountpoint}: {e}")
+        # Shares DiskUsageCheck's mount list and its timeout-bounded statvfs
+        # pool, so a hung network mount cannot block a health check worker
+        for entry in DiskUsageCheck.partition_usage(exclude_types):
+            percent = entry.percent
+
+            # Determine status for this disk
+            disk_status, disk_score = self._tier(percent, warning_threshold, critical_threshold)
+
+            # Track worst
+            if percent > max_percent:
+                max_percent = percent
+                worst_status = disk_status
+                worst_score = disk_score
+
+            disks.append({
+                'mountpoint': entry.mountpoint,
+                'device': entry.device,
+                'fstype': entry.fstype,
+                'percent': percent,
+                'total_gb': round(entry.total_bytes * _GB_INV, 2),
+                'used_gb': round(entry.used_bytes * _GB_INV, 2),
+                'free_gb': round(entry.free_bytes * _GB_INV, 2),
+                'status': disk_status,
+            })
 
         return {
             'disks': disks,
@@ -354,6 +766,31 @@ class SystemHealthCheck(BaseCheck):
         Get status of ALL loaded systemd services on the system.
 
         Shows all currently loaded services with their running/stopped and enabled/disabled status.
+        The listing is reused for SERVICES_TTL seconds.
+
+        Args:
+            services: List of service names (used for critical service detection)
+            critical_services: List of services that trigger critical status if down
+
+        Returns:
+            Dictionary with all service status information
+        """
+        cls = type(self)
+        now = time.monotonic()
+        critical_key = tuple(critical_services)
+        cached = cls._services_cache
+        if cached is not None and now - cached[0] < self.SERVICES_TTL:
+            if cached[1] == critical_key:
+                return dict(cached[2])
+
+        result = self._list_services_status(services, critical_services)
+        if 'error' not in result:
+            cls._services_cache = (now, critical_key, result)
+        return dict(result)
+
+    def _list_services_status(self, services: List[str], critical_services: List[str]) -> Dict[str, Any]:
+        """
+        Query systemd for the status of all loaded services.
 
         Args:
             services: List of service names (used for critical service detection)
@@ -363,6 +800,7 @@ class SystemHealthCheck(BaseCheck):
             Dictionary with all service status information
         """
         service_statuses = []
+        parsed_statuses = []
         running_count = 0
         stopped_count = 0
         enabled_count = 0
@@ -370,12 +808,16 @@ class SystemHealthCheck(BaseCheck):
         critical_down = []
 
         try:
+            # Enablement of every unit file in one call instead of one per service
+            unit_file_states = self._load_unit_file_states()
+
             # Get ALL currently loaded services from systemd using list-units
             # This shows services that are loaded into memory (active, inactive, failed)
             result = subprocess.run(
                 ['systemctl', 'list-units', '--type=service', '--all', '--no-pager', '--no-legend'],
                 capture_output=True,
-                text=True,
+                encoding='utf-8',
+                errors='replace',
                 timeout=30
             )
 
@@ -384,69 +826,64 @@ class SystemHealthCheck(BaseCheck):
                 return {'services': [], 'total': 0, 'status': 'passed', 'score': 100}
 
             # Parse the output: UNIT LOAD ACTIVE SUB DESCRIPTION
-            for line in result.stdout.strip().split('\n'):
-                if not line.strip():
-                    continue
+            matches = [match for match in map(_UNIT_LINE_RE.match, result.stdout.splitlines()) if match]
 
-                # Handle the bullet point that systemctl adds for failed services
-                line = line.lstrip('●').strip()
+            if unit_file_states is None:
+                # No unit file listing; ask about the listed units in one call instead
+                unit_file_states = self._show_unit_file_states([match.group('unit') for match in matches])
 
-                parts = line.split(None, 4)  # Split into max 5 parts
-                if len(parts) >= 4:
-                    unit_name = parts[0]
-                    load_state = parts[1]   # loaded, not-found, masked
-                    active_state = parts[2]  # active, inactive, failed
-                    sub_state = parts[3]     # running, exited, dead, failed
+            for match in matches:
+                unit_name = match.group('unit')
+                service_name = match.group('name')    # .service suffix removed for display
+                load_state = match.group('load')      # loaded, not-found, masked
+                active_state = match.group('active')  # active, inactive, failed
+                sub_state = match.group('sub')        # running, exited, dead, failed
 
-                    # Remove .service suffix for cleaner display
-                    service_name = unit_name.replace('.service', '')
+                # Skip template services (contain @)
+                if '@' in service_name:
+                    continue
 
-                    # Skip template services (contain @)
-                    if '@' in service_name:
-                        continue
+                # Skip not-found or masked services
+                if load_state in ['not-found', 'masked']:
+                    continue
 
-                    # Skip not-found or masked services
-                    if load_state in ['not-found', 'masked']:
-                        continue
+                # Check if service is enabled
+                is_enabled = unit_file_states.get(unit_name) == 'enabled'
 
-                    # Check if service is enabled
-                    is_enabled = self._is_service_enabled(unit_name)
-
-                    is_running = active_state == 'active' and sub_state == 'running'
-                    is_active = active_state == 'active'  # includes 'exited' services
-
-                    service_statuses.append({
-                        'name': service_name,
-                        'is_running': is_running,
-                        'is_enabled': is_enabled,
-                        'status': sub_state,  # running, exited, dead, failed
-                        'active_state': active_state,
-                    })
-
-                    # Count stats
-                    if is_running:
-                        running_count += 1
-                    elif active_state == 'active':
-                        # Service is active but not running (e.g., oneshot that exited)
-                        running_count += 1
-                    else:
-                        stopped_count += 1
+                is_running = active_state == 'active' and sub_state == 'running'
+                is_active = active_state == 'active'  # includes 'exited' services
 
-                    if is_enabled:
-                        enabled_count += 1
-                    else:
-                        disabled_count += 1
+                # Sort rank: running, then 'running' sub-state while not active, then the rest
+                rank = 0 if is_running else (1 if sub_state == 'running' else 2)
+                parsed_statuses.append(_ServiceStatus(
+                    rank, service_name, is_running, is_enabled, sub_state, active_state,
+                ))
 
-                    # Check if critical service is down
-                    if active_state != 'active' and service_name in critical_services:
-                        critical_down.append(service_name)
+                # Count stats
+                if is_running:
+                    running_count += 1
+                elif active_state == 'active':
+                    # Service is active but not running (e.g., oneshot that exited)
+                    running_count += 1
+                else:
+                    stopped_count += 1
+
+                if is_enabled:
+                    enabled_count += 1
+                else:
+                    disabled_count += 1
+
+                # Check if critical service is down
+                if active_state != 'active' and service_name in critical_services:
+                    critical_down.append(service_name)
 
             # Sort: running first, then by name
-            service_statuses.sort(key=lambda s: (s['status'] != 'running', not s['is_running'], s['name']))
+            parsed_statuses.sort(key=lambda entry: (entry.rank, entry.name))
+            service_statuses = [entry.to_dict() for entry in parsed_statuses]
 
             # Filter critical_down based on exclusive groups
             # If apache2 is running, nginx shouldn't be flagged as critical (and vice versa)
-            running_services = {s['name'] for s in service_statuses if s['is_running'] or s['active_state'] == 'active'}
+            running_services = {s.name for s in parsed_statuses if s.is_running or s.active_state == 'active'}
             filtered_critical_down = []
             for service in critical_down:
                 # Check if this service belongs to an exclusive group
@@ -537,10 +974,7 @@ class SystemHealthCheck(BaseCheck):
         Returns:
             List of services in the same exclusive group, or None
         """
-        for group in EXCLUSIVE_SERVICE_GROUPS:
-            if service_name in group:
-                return group
-        return None
+        return _SERVICE_TO_GROUP.get(service_name)
 
     def _get_active_services_from_group(self, group: List[str], requested_services: List[str]) -> List[str]:
         """
@@ -557,47 +991,43 @@ class SystemHealthCheck(BaseCheck):
         active = []
         enabled_not_running = []
 
-        for service in group:
-            # Only consider services that were in the original request
-            if service not in requested_services:
-                continue
-
-            try:
-                result = subprocess.run(
-                    ['systemctl', 'show', service, '--property=LoadState,ActiveState,UnitFileState'],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-
-                if result.returncode != 0:
-                    continue
-
-                props = {}
-                for line in result.stdout.strip().split('\n'):
-                    if '=' in line:
-                        key, value = line.split('=', 1)
-                        props[key] = value
+        # Only consider services that were in the original request
+        candidates = [service for service in group if service in requested_services]
+        if not candidates:
+            return []
 
-                load_state = props.get('LoadState', 'not-found')
-                active_state = props.get('ActiveState', 'unknown')
-                unit_file_state = props.get('UnitFileState', '')
+        try:
+            # One call for the whole group; systemctl prints one block per unit, in order
+            result = subprocess.run(
+                ['systemctl', 'show', *candidates, '--property=LoadState,ActiveState,UnitFileState'],
+                capture_output=True,
+                encoding='utf-8',
+                errors='replace',
+                timeout=5
+            )
+        except Exception as e:
+            logger.debug(f"Error checking services {candidates} for group filtering: {e}")
+            return []
 
-                # Skip if not loaded
-                if load_state in ['not-found', 'masked']:
-                    continue
+        if result.returncode != 0:
+            return []
 
-                # If running, this is the one to show
-                if active_state == 'active':
-                    active.append(service)
-                # If enabled but not running, track it
-                elif unit_file_state == 'enabled':
-                    enabled_not_running.append(service)
+        for service, props in zip(candidates, _parse_show_output(result.stdout)):
+            load_state = props.get('LoadState', 'not-found')
+            active_state = props.get('ActiveState', 'unknown')
+            unit_file_state = props.get('UnitFileState', '')
 
-            except Exception as e:
-                logger.debug(f"Error checking service {service} for group filtering: {e}")
+            # Skip if not loaded
+            if load_state in ['not-found', 'masked']:
                 continue
 
+            # If running, this is the one to show
+            if active_state == 'active':
+                active.append(service)
+            # If enabled but not running, track it
+            elif unit_file_state == 'enabled':
+                enabled_not_running.append(service)
+
         # Prefer running services, fall back to enabled services
         if active:
             return active
@@ -623,10 +1053,13 @@ class SystemHealthCheck(BaseCheck):
         try:
             # Check if service is installed by checking its LoadState
             # A service is "installed" if LoadState is "loaded" (not "not-found")
+            # ActiveEnterTimestamp is fetched in the same call for active services
             load_result = subprocess.run(
-                ['systemctl', 'show', service_name, '--property=LoadState,ActiveState,UnitFileState'],
+                ['systemctl', 'show', service_name,
+                 '--property=LoadState,ActiveState,UnitFileState,ActiveEnterTimestamp'],
                 capture_output=True,
-                text=True,
+                encoding='utf-8',
+                errors='replace',
                 timeout=5
             )
 
@@ -634,11 +1067,7 @@ class SystemHealthCheck(BaseCheck):
                 return None
 
             # Parse the output
-            props = {}
-            for line in load_result.stdout.strip().split('\n'):
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    props[key] = value
+            props = _parse_show_output(load_result.stdout)[0]
 
             load_state = props.get('LoadState', 'not-found')
             active_state = props.get('ActiveState', 'unknown')
@@ -656,19 +1085,10 @@ class SystemHealthCheck(BaseCheck):
             is_active = active_state == 'active'
             status_text = active_state
 
-            # If service is active, get more details
+            # If service is active, report when it started
             started_at = None
-            if is_active:
-                status_result = subprocess.run(
-                    ['systemctl', 'show', service_name, '--property=ActiveEnterTimestamp'],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                if status_result.returncode == 0 and status_result.stdout:
-                    timestamp_line = status_result.stdout.strip()
-                    if '=' in timestamp_line:
-                        started_at = timestamp_line.split('=', 1)[1].strip()
+            if is_active and 'ActiveEnterTimestamp' in props:
+                started_at = props['ActiveEnterTimestamp'].strip()
 
             return {
                 'name': service_name,
@@ -702,7 +1122,8 @@ class SystemHealthCheck(BaseCheck):
             result = subprocess.run(
                 ['service', service_name, 'status'],
                 capture_output=True,
-                text=True,
+                encoding='utf-8',
+                errors='replace',
                 timeout=5
             )
 
@@ -721,20 +1142,34 @@ class SystemHealthCheck(BaseCheck):
 
         except Exception:
             # Check if process is running by name
-            for proc in psutil.process_iter(['name']):
-                try:
-                    if service_name in proc.info['name'].lower():
-                        return {
-                            'name': service_name,
-                            'is_running': True,
-                            'status': 'running',
-                            'started_at': None,
-                        }
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
+            if any(service_name in name for name in self._get_process_names()):
+                return {
+                    'name': service_name,
+                    'is_running': True,
+                    'status': 'running',
+                    'started_at': None,
+                }
 
             return None
 
+    def _get_process_names(self) -> FrozenSet[str]:
+        """
+        Get the lowercased names of all running processes.
+
+        Built once per check run so that falling back to process matching for
+        several services scans the process table only once.
+
+        Returns:
+            Set of process names
+        """
+        if self._process_names is None:
+            self._process_names = frozenset(
+                proc.info['name'].lower()
+                for proc in psutil.process_iter(['name'])
+                if proc.info['name']
+            )
+        return self._process_names
+
     def _get_top_processes(self, count: int = 25) -> Dict[str, Any]:
         """
         Get top processes by CPU and Memory usage.
@@ -745,78 +1180,132 @@ class SystemHealthCheck(BaseCheck):
         Returns:
             Dictionary with top processes by CPU and Memory
         """
-        processes = []
-
-        # Iterate through all processes
-        for proc in psutil.process_iter(['pid', 'name', 'username', 'cpu_percent', 'memory_percent', 'cmdline']):
-            try:
-                pinfo = proc.info
-                # Skip system processes with no name
-                if not pinfo['name']:
-                    continue
-
-                # Get command line (truncate if too long)
-                cmdline = ' '.join(pinfo['cmdline']) if pinfo['cmdline'] else pinfo['name']
-                if len(cmdline) > 200:
-                    cmdline = cmdline[:197] + '...'
-
-                processes.append({
-                    'pid': pinfo['pid'],
-                    'name': pinfo['name'],
-                    'user': pinfo['username'] or 'N/A',
-                    'cpu_percent': pinfo['cpu_percent'] or 0.0,
-                    'memory_percent': pinfo['memory_percent'] or 0.0,
-                    'command': cmdline,
-                })
-            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+        processes: List[_ProcessRow] = []
+
+        # Iterate through all processes; attributes we may not read come back as
+        # None and vanished processes are skipped by process_iter itself
+        attrs = ['pid', 'name', 'username', 'cpu_percent', 'memory_percent', 'cmdline']
+        for proc in psutil.process_iter(attrs, ad_value=None):
+            pinfo = proc.info
+            # Skip system processes with no name
+            if not pinfo['name']:
                 continue
 
-        # Sort by CPU and get top N
-        top_by_cpu = sorted(processes, key=lambda p: p['cpu_percent'], reverse=True)[:count]
-
-        # Sort by Memory and get top N
-        top_by_memory = sorted(processes, key=lambda p: p['memory_percent'], reverse=True)[:count]
-
-        # Format percentages to 1 decimal place
-        for p in top_by_cpu:
-            p['cpu_percent'] = round(p['cpu_percent'], 1)
-            p['memory_percent'] = round(p['memory_percent'], 1)
+            processes.append(_ProcessRow(
+                pid=pinfo['pid'],
+                name=pinfo['name'],
+                user=pinfo['username'] or 'N/A',
+                cpu_percent=round(pinfo['cpu_percent'] or 0.0, 1),
+                memory_percent=round(pinfo['memory_percent'] or 0.0, 1),
+                cmdline=pinfo['cmdline'],
+            ))
 
-        for p in top_by_memory:
-            p['cpu_percent'] = round(p['cpu_percent'], 1)
-            p['memory_percent'] = round(p['memory_percent'], 1)
+        # Top N by CPU and by Memory, without sorting the full list; only the
+        # selected rows are turned into dicts
+        top_by_cpu = [row.to_dict() for row in heapq.nlargest(count, processes, key=attrgetter('cpu_percent'))]
+        top_by_memory = [row.to_dict() for row in heapq.nlargest(count, processes, key=attrgetter('memory_percent'))]
 
         return {
             'top_by_cpu': top_by_cpu,
             'top_by_memory': top_by_memory,
         }
 
-    def _get_service_active_state(self, service_name: str) -> str:
-        """Get the active state of a service."""
+    def _load_unit_file_states(self) -> Optional[Dict[str, str]]:
+        """
+        Get the enablement state of every service unit file.
+
+        Returns:
+            Dictionary of unit name to state (enabled, disabled, static, ...),
+            or None if systemctl could not list unit files
+        """
         try:
             result = subprocess.run(
-                ['systemctl', 'is-active', service_name],
+                ['systemctl', 'list-unit-files', '--type=service', '--no-pager', '--no-legend'],
                 capture_output=True,
-                text=True,
-                timeout=5
+                encoding='utf-8',
+                errors='replace',
+                timeout=10
             )
-            return result.stdout.strip()
-        except Exception:
-            return 'unknown'
+        except (subprocess.TimeoutExpired, OSError) as e:
+            logger.debug(f"Error listing unit files: {e}")
+            return None
+
+        if result.returncode != 0:
+            return None
+
+        # Parse the output: UNIT FILE STATE [PRESET]
+        states = {}
+        for line in result.stdout.splitlines():
+            parts = line.split(None, 2)
+            if len(parts) >= 2:
+                states[parts[0]] = parts[1]
+        return states
+
+    def _show_unit_file_states(self, units: List[str]) -> Dict[str, str]:
+        """
+        Get the enablement state of the given units with one systemctl call.
+
+        Args:
+            units: Unit names, including the .service suffix
 
-    def _is_service_enabled(self, service_name: str) -> bool:
-        """Check if a service is enabled (starts at boot)."""
+        Returns:
+            Dictionary of unit name to state; empty if systemctl failed
+        """
+        if not units:
+            return {}
         try:
+            # systemctl prints one block per unit, in order
             result = subprocess.run(
-                ['systemctl', 'is-enabled', service_name],
+                ['systemctl', 'show', *units, '--property=UnitFileState'],
                 capture_output=True,
-                text=True,
-                timeout=5
+                encoding='utf-8',
+                errors='replace',
+                timeout=10
             )
-            # enabled, disabled, static, masked, etc.
-            return result.stdout.strip() == 'enabled'
-        except Exception:
-            return False
+        except Exception as e:
+            logger.debug(f"Error checking unit file states: {e}")
+            return {}
+
+        if result.returncode != 0:
+            return {}
+
+        return {
+            unit: props.get('UnitFileState', '')
+            for unit, props in zip(units, _parse_show_output(result.stdout))
+        }
+
+    def _cached_probe(self, name: str, probe: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Run a security probe, reusing its result for SECURITY_PROBE_TTL seconds.
+
+        Firewall rules and listening ports rarely change between checks, so
+        this saves their subprocess calls on frequent runs. Error results are
+        not cached.
+
+        Args:
+            name: Cache key for the probe
+            probe: Method producing the result
+
+        Returns:
+            The probe result
+        """
+        cache = type(self)._probe_cache
+        now = time.monotonic()
+        cached = cache.get(name)
+        if cached is not None and now - cached[0] < self.SECURITY_PROBE_TTL:
+            return dict(cached[1])
+
+        result = probe()
+        if 'error' not in result:
+            cache[name] = (now, result)
+        return dict(result)
+
+    @classmethod
+    def _get_firewall_tools(cls) -> FrozenSet[str]:
+        """Get the firewall tools found on PATH, looked up once per process."""
+        if cls._firewall_tools is None:
+            cls._firewall_tools = frozenset(tool for tool in _FIREWALL_TOOLS if shutil.which(tool))
+        return cls._firewall_tools
 
     def _get_firewall_status(self) -> Dict[str, Any]:
         """
@@ -832,118 +1321,89 @@ class SystemHealthCheck(BaseCheck):
             'details': None,
         }
 
+        # Only try the tools that are installed
+        tools = self._get_firewall_tools()
+
         # Check UFW (Ubuntu/Debian)
-        try:
-            result = subprocess.run(
-                ['ufw', 'status'],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            if result.returncode == 0:
-                output = result.stdout.strip()
-                if 'Status: active' in output:
+        if 'ufw' in tools:
+            try:
+                result = _run_command(['ufw', 'status'])
+                if result is not None and result.returncode == 0:
+                    output = result.stdout.strip()
+                    if 'Status: active' in output:
+                        firewall_info['active'] = True
+                        firewall_info['type'] = 'ufw'
+                        firewall_info['status'] = 'active'
+                        # Parse rules, skipping the status and table header lines
+                        sections = output.split('\n', 4)
+                        rules = _UFW_RULE_RE.findall(sections[4]) if len(sections) > 4 else []
+                        firewall_info['details'] = {'rules_count': len(rules), 'rules': rules[:20]}  # Limit to 20 rules
+                        return firewall_info
+                    elif 'Status: inactive' in output:
+                        firewall_info['type'] = 'ufw'
+                        firewall_info['status'] = 'inactive'
+                        return firewall_info
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.debug(f"UFW check error: {e}")
+
+        # Check firewalld (RHEL/CentOS/Fedora)
+        if 'firewall-cmd' in tools:
+            try:
+                result = _run_command(['firewall-cmd', '--state'])
+                if result is None:
+                    pass
+                elif result.returncode == 0 and 'running' in result.stdout.lower():
                     firewall_info['active'] = True
-                    firewall_info['type'] = 'ufw'
-                    firewall_info['status'] = 'active'
-                    # Parse rules
-                    rules = []
-                    lines = output.split('\n')
-                    for line in lines[4:]:  # Skip header lines
-                        if line.strip():
-                            rules.append(line.strip())
-                    firewall_info['details'] = {'rules_count': len(rules), 'rules': rules[:20]}  # Limit to 20 rules
+                    firewall_info['type'] = 'firewalld'
+                    firewall_info['status'] = 'running'
+
+                    # Get zones, services and ports in one shell instead of three processes
+                    zones, services, ports = _run_batched(
+                        [['firewall-cmd', query] for query in _FIREWALLD_QUERIES],
+                        timeout=10 * len(_FIREWALLD_QUERIES),
+                    )
+
+                    firewall_info['details'] = {
+                        'zones': zones.strip() if zones is not None else '',
+                        'allowed_services': services.strip().split() if services is not None else [],
+                        'allowed_ports': ports.strip().split() if ports is not None else [],
+                    }
                     return firewall_info
-                elif 'Status: inactive' in output:
-                    firewall_info['type'] = 'ufw'
-                    firewall_info['status'] = 'inactive'
+                elif 'not running' in result.stdout.lower() or result.returncode != 0:
+                    firewall_info['type'] = 'firewalld'
+                    firewall_info['status'] = 'not running'
                     return firewall_info
-        except FileNotFoundError:
-            pass
-        except Exception as e:
-            logger.debug(f"UFW check error: {e}")
-
-        # Check firewalld (RHEL/CentOS/Fedora)
-        try:
-            result = subprocess.run(
-                ['firewall-cmd', '--state'],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            if result.returncode == 0 and 'running' in result.stdout.lower():
-                firewall_info['active'] = True
-                firewall_info['type'] = 'firewalld'
-                firewall_info['status'] = 'running'
-
-                # Get zones and services
-                zones_result = subprocess.run(
-                    ['firewall-cmd', '--get-active-zones'],
-                    capture_output=True,
-                    text=True,
-                    timeout=10
-                )
-                services_result = subprocess.run(
-                    ['firewall-cmd', '--list-services'],
-                    capture_output=True,
-                    text=True,
-                    timeout=10
-                )
-                ports_result = subprocess.run(
-                    ['firewall-cmd', '--list-ports'],
-                    capture_output=True,
-                    text=True,
-                    timeout=10
-                )
-
-                firewall_info['details'] = {
-                    'zones': zones_result.stdout.strip() if zones_result.returncode == 0 else '',
-                    'allowed_services': services_result.stdout.strip().split() if services_result.returncode == 0 else [],
-                    'allowed_ports': ports_result.stdout.strip().split() if ports_result.returncode == 0 else [],
-                }
-                return firewall_info
-            elif 'not running' in result.stdout.lower() or result.returncode != 0:
-                firewall_info['type'] = 'firewalld'
-                firewall_info['status'] = 'not running'
-                return firewall_info
-        except FileNotFoundError:
-            pass
-        except Exception as e:
-            logger.debug(f"firewalld check error: {e}")
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.debug(f"firewalld check error: {e}")
 
         # Check iptables as fallback
-        try:
-            result = subprocess.run(
-                ['iptables', '-L', '-n', '--line-numbers'],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            if result.returncode == 0:
-                output = result.stdout.strip()
-                lines = output.split('\n')
-                # Count non-empty, non-header rules
-                rule_count = 0
-                for line in lines:
-                    if line and not line.startswith('Chain') and not line.startswith('num'):
-                        rule_count += 1
-
+        if 'iptables' in tools:
+            try:
+                result = _run_command(['iptables', '-L', '-n', '--line-numbers'])
+                if result is not None and result.returncode == 0:
+                    # Count non-empty, non-header rules
+                    rule_count = len(_IPTABLES_RULE_RE.findall(result.stdout.strip()))
+
+                    firewall_info['type'] = 'iptables'
+                    if rule_count > 0:
+                        firewall_info['active'] = True
+                        firewall_info['status'] = 'configured'
+                        firewall_info['details'] = {'rules_count': rule_count}
+                    else:
+                        firewall_info['status'] = 'no rules'
+                    return firewall_info
+            except FileNotFoundError:
+                pass
+            except PermissionError:
                 firewall_info['type'] = 'iptables'
-                if rule_count > 0:
-                    firewall_info['active'] = True
-                    firewall_info['status'] = 'configured'
-                    firewall_info['details'] = {'rules_count': rule_count}
-                else:
-                    firewall_info['status'] = 'no rules'
+                firewall_info['status'] = 'permission denied'
                 return firewall_info
-        except FileNotFoundError:
-            pass
-        except PermissionError:
-            firewall_info['type'] = 'iptables'
-            firewall_info['status'] = 'permission denied'
-            return firewall_info
-        except Exception as e:
-            logger.debug(f"iptables check error: {e}")
+            except Exception as e:
+                logger.debug(f"iptables check error: {e}")
 
         # No firewall found
         firewall_info['status'] = 'no firewall detected'
@@ -959,124 +1419,37 @@ class SystemHealthCheck(BaseCheck):
         open_ports = []
         risky_ports = []
 
-        # Well-known risky ports that shouldn't be publicly exposed
-        RISKY_PORTS = {
-            21: 'FTP',
-            22: 'SSH',
-            23: 'Telnet',
-            25: 'SMTP',
-            135: 'MSRPC',
-            137: 'NetBIOS',
-            138: 'NetBIOS',
-            139: 'NetBIOS',
-            445: 'SMB',
-            1433: 'MSSQL',
-            1434: 'MSSQL',
-            3306: 'MySQL',
-            3389: 'RDP',
-            5432: 'PostgreSQL',
-            5900: 'VNC',
-            6379: 'Redis',
-            11211: 'Memcached',
-            27017: 'MongoDB',
-        }
-
-        # Ports that are typically safe to expose
-        SAFE_PUBLIC_PORTS = {80, 443, 8080, 8443}
-
         try:
-            # Try ss first (modern systems)
-            result = subprocess.run(
-                ['ss', '-tuln'],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-
-            if result.returncode == 0:
-                lines = result.stdout.strip().split('\n')[1:]  # Skip header
-
-                for line in lines:
-                    parts = line.split()
-                    if len(parts) >= 5:
-                        state = parts[0]
-                        local_addr = parts[4]
-
-                        # Parse address and port
-                        if ':' in local_addr:
-                            # Handle IPv6 [::]:port format
-                            if local_addr.startswith('['):
-                                addr_parts = local_addr.rsplit(':', 1)
-                                addr = addr_parts[0]
-                                port = int(addr_parts[1]) if len(addr_parts) > 1 else 0
-                            else:
-                                # IPv4 or simple format
-                                addr_parts = local_addr.rsplit(':', 1)
-                                addr = addr_parts[0]
-                                port = int(addr_parts[1]) if len(addr_parts) > 1 and addr_parts[1].isdigit() else 0
-
-                            if port == 0:
-                                continue
-
-                            # Check if listening on all interfaces (publicly accessible)
-                            is_public = addr in ['*', '0.0.0.0', '[::]', '::']
-
-                            port_info = {
-                                'port': port,
-                                'address': addr,
-                                'protocol': 'tcp' if 'tcp' in state.lower() or parts[0] == 'LISTEN' else 'udp',
-                                'is_public': is_public,
-                                'service': RISKY_PORTS.get(port, self._get_service_name(port)),
-                            }
-                            open_ports.append(port_info)
-
-                            # Check if this is a risky port exposed publicly
-                            if is_public and port in RISKY_PORTS and port not in SAFE_PUBLIC_PORTS:
-                                risky_ports.append({
-                                    'port': port,
-                                    'service': RISKY_PORTS[port],
-                                    'risk': 'high' if port in [23, 3389, 5900, 6379, 11211, 27017] else 'medium',
-                                })
-
-        except FileNotFoundError:
-            # Fall back to netstat
-            try:
-                result = subprocess.run(
-                    ['netstat', '-tuln'],
-                    capture_output=True,
-                    text=True,
-                    timeout=10
-                )
-                if result.returncode == 0:
-                    lines = result.stdout.strip().split('\n')[2:]  # Skip headers
-                    for line in lines:
-                        parts = line.split()
-                        if len(parts) >= 4:
-                            local_addr = parts[3]
-                            if ':' in local_addr:
-                                addr, port_str = local_addr.rsplit(':', 1)
-                                if port_str.isdigit():
-                                    port = int(port_str)
-                                    is_public = addr in ['*', '0.0.0.0', '::']
-                                    open_ports.append({
-                                        'port': port,
-                                        'address': addr,
-                                        'protocol': 'tcp' if 'tcp' in parts[0].lower() else 'udp',
-                                        'is_public': is_public,
-                                        'service': RISKY_PORTS.get(port, self._get_service_name(port)),
-                                    })
-                                    if is_public and port in RISKY_PORTS and port not in SAFE_PUBLIC_PORTS:
-                                        risky_ports.append({
-                                            'port': port,
-                                            'service': RISKY_PORTS[port],
-                                            'risk': 'high' if port in [23, 3389, 5900, 6379, 11211, 27017] else 'medium',
-                                        })
-            except Exception as e:
-                logger.debug(f"netstat fallback failed: {e}")
-
+            listeners = self._list_listeners()
         except Exception as e:
             logger.error(f"Error checking open ports: {e}")
             return {'ports': [], 'error': str(e)}
+        if listeners is None:
+            return {'ports': [], 'error': 'timeout'}
+
+        for protocol, addr, port in listeners:
+            if port == 0:
+                continue
+
+            # Check if listening on all interfaces (publicly accessible)
+            is_public = addr in ['*', '0.0.0.0', '[::]', '::']
+
+            port_info = {
+                'port': port,
+                'address': addr,
+                'protocol': protocol,
+                'is_public': is_public,
+                'service': self._get_service_name(port),
+            }
+            open_ports.append(port_info)
+
+            # Check if this is a risky port exposed publicly
+            if is_public and port in _RISKY_PORTS and port not in _SAFE_PUBLIC_PORTS:
+                risky_ports.append({
+                    'port': port,
+                    'service': _RISKY_PORTS[port],
+                    'risk': 'high' if port in _HIGH_RISK_PORTS else 'medium',
+                })
 
         # Sort ports
         open_ports.sort(key=lambda p: p['port'])
@@ -1091,7 +1464,7 @@ class SystemHealthCheck(BaseCheck):
             else:
                 security_status = 'warning'
                 security_message = f"{len(risky_ports)} potentially risky port(s) publicly exposed"
-        elif len(public_ports) > len(SAFE_PUBLIC_PORTS):
+        elif len(public_ports) > len(_SAFE_PUBLIC_PORTS):
             security_status = 'info'
             security_message = f"{len(public_ports)} public ports open (review recommended)"
         else:
@@ -1108,24 +1481,54 @@ class SystemHealthCheck(BaseCheck):
             'security_message': security_message,
         }
 
-    def _get_service_name(self, port: int) -> str:
-        """Get common service name for a port."""
-        common_ports = {
-            80: 'HTTP',
-            443: 'HTTPS',
-            8080: 'HTTP-ALT',
-            8443: 'HTTPS-ALT',
-            53: 'DNS',
-            110: 'POP3',
-            143: 'IMAP',
-            993: 'IMAPS',
-            995: 'POP3S',
-            587: 'SMTP-MSA',
-            465: 'SMTPS',
-            9200: 'Elasticsearch',
-            9300: 'Elasticsearch',
-            9000: 'PHP-FPM',
-            15672: 'RabbitMQ',
-            5672: 'AMQP',
-        }
-        return common_ports.get(port, '')
+    def _list_listeners(self) -> Optional[List[Tuple[str, str, int]]]:
+        """
+        List listening TCP and bound UDP sockets.
+
+        Reads the kernel socket tables under /proc/net directly; systems
+        without them fall back to ss, then netstat.
+
+        Returns:
+            List of (protocol, address, port) tuples, or None if ss timed out
+        """
+        listeners = _read_proc_listeners()
+        if listeners is not None:
+            return listeners
+
+        listeners = []
+        try:
+            # Try ss first (modern systems)
+            result = _run_command(['ss', '-tuln'])
+            if result is None:
+                return None
+
+            if result.returncode == 0:
+                for match in _SS_LISTEN_RE.finditer(result.stdout):
+                    netid, addr, port = match.group('netid', 'addr', 'port')
+                    protocol = 'tcp' if 'tcp' in netid.lower() or netid == 'LISTEN' else 'udp'
+                    listeners.append((protocol, addr, int(port)))
+
+        except FileNotFoundError:
+            # Fall back to netstat
+            try:
+                result = _run_command(['netstat', '-tuln'])
+                if result is not None and result.returncode == 0:
+                    lines = result.stdout.strip().split('\n')[2:]  # Skip headers
+                    for line in lines:
+                        parts = line.split()
+                        if len(parts) >= 4:
+                            local_addr = parts[3]
+                            if ':' in local_addr:
+                                addr, port_str = local_addr.rsplit(':', 1)
+                                if port_str.isdigit():
+                                    protocol = 'tcp' if 'tcp' in parts[0].lower() else 'udp'
+                                    listeners.append((protocol, addr, int(port_str)))
+            except Exception as e:
+                logger.debug(f"netstat fallback failed: {e}")
+
+        return listeners
+
+    @staticmethod
+    def _get_service_name(port: int) -> str:
+        """Get the well-known service name for a port, or '' if unknown."""
+        return _PORT_SERVICES.get(port, '')
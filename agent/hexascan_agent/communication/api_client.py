@@ -4,13 +4,21 @@ API client for communicating with HexaScan server.
 Handles authentication, request signing, and backoff strategies.
 """
 
+import json
 import logging
+import sys
 import time
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
-from urllib.parse import urljoin
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:
+    # Optional: faster JSON encoding and decoding; falls back to the json module
+    orjson = None
 
 from .exceptions import (
     ApiError,
@@ -22,8 +30,11 @@ from .exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Slotted dataclasses need Python 3.10; older interpreters keep a __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Task:
     """Represents a task from the server."""
 
@@ -34,8 +45,20 @@ class Task:
     config: Dict[str, Any]
     priority: int = 0
 
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> 'Task':
+        """Build a task from one entry of the /agent/tasks response."""
+        return cls(
+            id=data.get('taskId') or data.get('id'),  # Support both taskId and id
+            check_id=data['checkId'],
+            check_type=data['checkType'],
+            site_id=data['siteId'],
+            config=data.get('checkConfig') or data.get('config', {}),  # Support both checkConfig and config
+            priority=data.get('priority', 0),
+        )
+
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class TaskResult:
     """Result of a task execution."""
 
@@ -63,12 +86,18 @@ class ApiClient:
     SERVER_ERROR_BACKOFF = [300, 600, 1200]  # seconds
     MAX_RETRIES = 3
 
+    # Connection pool: the agent talks to one API host, from the main loop and
+    # up to a few concurrent task threads submitting results
+    POOL_CONNECTIONS = 1
+    POOL_MAXSIZE = 8
+
     def __init__(
         self,
         endpoint: str,
         api_key: str,
         timeout: int = 30,
         verify_ssl: bool = True,
+        max_connections: Optional[int] = None,
     ):
         """
         Initialize API client.
@@ -78,13 +107,26 @@ class ApiClient:
             api_key: Agent API key for authentication
             timeout: Request timeout in seconds
             verify_ssl: Whether to verify SSL certificates
+            max_connections: Connections kept alive to the server; set to the
+                number of threads making requests (default: POOL_MAXSIZE)
         """
         self.endpoint = endpoint.rstrip('/')
+        self._base_url = self.endpoint + '/'
         self.api_key = api_key
         self.timeout = timeout
         self.verify_ssl = verify_ssl
         self.session = requests.Session()
 
+        # Keep connections to the API host alive across heartbeat, polling and
+        # result submission; urllib3 logs each new connection at debug level
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_CONNECTIONS,
+            pool_maxsize=max_connections or self.POOL_MAXSIZE,
+            max_retries=0,
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
         # Set default headers
         self.session.headers.update({
             'Content-Type': 'application/json',
@@ -94,19 +136,55 @@ class ApiClient:
         })
 
         # Backoff state
+        self._backoff = {
+            'rate_limit': self.RATE_LIMIT_BACKOFF,
+            'server_error': self.SERVER_ERROR_BACKOFF,
+        }
         self._current_backoff_index = 0
         self._last_error_type: Optional[str] = None
 
     def _build_url(self, path: str) -> str:
-        """Build full URL from path."""
-        return urljoin(self.endpoint + '/', path.lstrip('/'))
+        """Build full URL from an API path such as '/agent/tasks'."""
+        return self._base_url + path.lstrip('/')
+
+    @staticmethod
+    def _encode_body(data: Optional[Dict[str, Any]]) -> Optional[bytes]:
+        """
+        Serialize a request body as JSON.
+
+        Uses orjson when it is installed, otherwise the json module with the
+        same output requests would produce for json=data.
+
+        Args:
+            data: Request body data
+
+        Returns:
+            Encoded body, or None if there is no body
+
+        Raises:
+            requests.exceptions.InvalidJSONError: If data cannot be serialized
+        """
+        if data is None:
+            return None
+        if orjson:
+            try:
+                return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+            except TypeError:
+                # Types orjson does not know; let the json module have a go
+                pass
+        try:
+            return json.dumps(data, allow_nan=False).encode('utf-8')
+        except (TypeError, ValueError) as e:
+            raise requests.exceptions.InvalidJSONError(e)
 
-    def _handle_response(self, response: requests.Response) -> Dict[str, Any]:
+    def _handle_response(self, response: requests.Response, parse_body: bool = True) -> Dict[str, Any]:
         """
         Handle API response and raise appropriate exceptions.
 
         Args:
             response: HTTP response object
+            parse_body: Parse the body of a successful response; when False an
+                empty dict is returned instead
 
         Returns:
             Parsed JSON response
@@ -119,9 +197,14 @@ class ApiClient:
         """
         status_code = response.status_code
 
+        # Success without a body the caller needs
+        if not parse_body and 200 <= status_code < 300:
+            self._reset_backoff()
+            return {}
+
         # Parse response body
         try:
-            data = response.json()
+            data = orjson.loads(response.content) if orjson else response.json()
         except ValueError:
             data = {'message': response.text or 'Unknown error'}
 
@@ -182,11 +265,7 @@ class ApiClient:
             self._current_backoff_index = 0
             self._last_error_type = error_type
 
-        if error_type == 'rate_limit':
-            backoff_list = self.RATE_LIMIT_BACKOFF
-        else:
-            backoff_list = self.SERVER_ERROR_BACKOFF
-
+        backoff_list = self._backoff.get(error_type, self.SERVER_ERROR_BACKOFF)
         interval = backoff_list[min(self._current_backoff_index, len(backoff_list) - 1)]
         self._current_backoff_index += 1
 
@@ -198,6 +277,7 @@ class ApiClient:
         path: str,
         data: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
+        parse_body: bool = True,
     ) -> Dict[str, Any]:
         """
         Make HTTP request to API.
@@ -207,6 +287,8 @@ class ApiClient:
             path: API path
             data: Request body data
             params: Query parameters
+            parse_body: Parse a successful response body; when False an
+                empty dict is returned instead (error bodies are always parsed)
 
         Returns:
             Parsed JSON response
@@ -218,15 +300,16 @@ class ApiClient:
         url = self._build_url(path)
 
         try:
+            body = self._encode_body(data)
             response = self.session.request(
                 method=method,
                 url=url,
-                json=data,
+                data=body,
                 params=params,
                 timeout=self.timeout,
                 verify=self.verify_ssl,
             )
-            return self._handle_response(response)
+            return self._handle_response(response, parse_body)
 
         except requests.exceptions.ConnectionError as e:
             raise ConnectionError(
@@ -250,7 +333,7 @@ class ApiClient:
             status: Agent status ('ONLINE', 'OFFLINE', 'ERROR')
 
         Returns:
-            Server response with agent configuration
+            Empty dict; the acknowledgment body is not parsed
         """
         logger.debug("Sending heartbeat")
         payload = {
@@ -259,7 +342,7 @@ class ApiClient:
         if metadata:
             payload['metadata'] = metadata
 
-        response = self._request('POST', '/agent/heartbeat', data=payload)
+        response = self._request('POST', '/agent/heartbeat', data=payload, parse_body=False)
         logger.debug("Heartbeat successful")
         return response
 
@@ -273,17 +356,7 @@ class ApiClient:
         logger.debug("Polling for tasks")
         response = self._request('GET', '/agent/tasks')
 
-        tasks = []
-        for task_data in response.get('data', {}).get('tasks', []):
-            task = Task(
-                id=task_data.get('taskId') or task_data.get('id'),  # Support both taskId and id
-                check_id=task_data['checkId'],
-                check_type=task_data['checkType'],
-                site_id=task_data['siteId'],
-                config=task_data.get('checkConfig') or task_data.get('config', {}),  # Support both checkConfig and config
-                priority=task_data.get('priority', 0),
-            )
-            tasks.append(task)
+        tasks = [Task.from_api(task_data) for task_data in response.get('data', {}).get('tasks', [])]
 
         logger.info(f"Received {len(tasks)} tasks")
         return tasks
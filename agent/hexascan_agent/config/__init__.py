@@ -1,5 +1,5 @@
 """Configuration module for HexaScan agent."""
 
-from .loader import AgentConfig, load_config
+from .loader import AgentConfig, load_config, load_config_header
 
-__all__ = ['AgentConfig', 'load_config']
+__all__ = ['AgentConfig', 'load_config', 'load_config_header']
@@ -4,18 +4,47 @@ Configuration loader for HexaScan agent.
 Loads and validates configuration from YAML files.
 """
 
+import copy
 import os
 import logging
+import sys
+import types
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any
+from functools import cached_property
+from operator import itemgetter
+from typing import Optional, Dict, Any, NamedTuple, Tuple
 from pathlib import Path
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    # PyYAML built without libyaml; same results, parsed in pure Python
+    from yaml import SafeLoader as _SafeLoader
+
 logger = logging.getLogger(__name__)
 
+# The agent never changes directory, so relative paths resolve against this
+try:
+    _CWD = os.getcwd()
+except OSError:
+    # Started from a directory that no longer exists
+    _CWD = '/'
+
+
+def _abspath(path: str) -> str:
+    """os.path.abspath() without a getcwd() call for relative paths."""
+    # join() keeps absolute paths as they are
+    return os.path.normpath(os.path.join(_CWD, path))
+
+# Config objects are shared by every caller of load_config(), so they are
+# frozen; slotted dataclasses need Python 3.10, older interpreters keep a __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 # Default configuration values
-DEFAULT_CONFIG = {
+# Read-only at the top level; load_config deep-copies it before merging
+DEFAULT_CONFIG = types.MappingProxyType({
     'agent': {
         'name': 'hexascan-agent',
         'version': '1.0.0',
@@ -47,10 +76,10 @@ DEFAULT_CONFIG = {
         'max_size_mb': 10,
         'backup_count': 5,
     },
-}
+})
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class ApiConfig:
     """API connection configuration."""
     endpoint: str
@@ -60,31 +89,58 @@ class ApiConfig:
     verify_ssl: bool = True
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class PermissionsConfig:
-    """Permission configuration."""
+    """Permission configuration; paths are absolute, resolved at load time."""
     level: str = 'read_only'
-    allowed_paths: List[str] = field(default_factory=list)
-    denied_paths: List[str] = field(default_factory=list)
+    allowed_paths: Tuple[str, ...] = field(default_factory=tuple)
+    denied_paths: Tuple[str, ...] = field(default_factory=tuple)
 
 
-@dataclass
-class CheckThresholds:
-    """Threshold configuration for a check."""
+class CheckThresholds(NamedTuple):
+    """Threshold configuration for a check; unpacks as (enabled, warning, critical)."""
     enabled: bool = True
     warning_threshold: int = 80
     critical_threshold: int = 90
 
 
-@dataclass
 class SystemChecksConfig:
-    """System checks configuration."""
-    disk: CheckThresholds = field(default_factory=CheckThresholds)
-    cpu: CheckThresholds = field(default_factory=CheckThresholds)
-    memory: CheckThresholds = field(default_factory=CheckThresholds)
+    """
+    System checks configuration.
+
+    Holds the merged checks.system settings and builds each check's
+    thresholds the first time they are read.
+    """
+
+    def __init__(self, checks_cfg: Optional[Dict[str, Any]] = None):
+        self._checks_cfg = checks_cfg or {}
+
+    @cached_property
+    def disk(self) -> CheckThresholds:
+        """Disk usage thresholds."""
+        return self._thresholds('disk', 80, 90)
 
+    @cached_property
+    def cpu(self) -> CheckThresholds:
+        """CPU usage thresholds."""
+        return self._thresholds('cpu', 80, 95)
 
-@dataclass
+    @cached_property
+    def memory(self) -> CheckThresholds:
+        """Memory usage thresholds."""
+        return self._thresholds('memory', 85, 95)
+
+    def _thresholds(self, name: str, warning: int, critical: int) -> CheckThresholds:
+        """Build thresholds for a check, with its default warning and critical levels."""
+        check_cfg = self._checks_cfg.get(name, {})
+        return CheckThresholds(
+            enabled=check_cfg.get('enabled', True),
+            warning_threshold=check_cfg.get('warning_threshold', warning),
+            critical_threshold=check_cfg.get('critical_threshold', critical),
+        )
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class LoggingConfig:
     """Logging configuration."""
     level: str = 'INFO'
@@ -93,7 +149,7 @@ class LoggingConfig:
     backup_count: int = 5
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class AgentConfig:
     """Main agent configuration."""
     name: str
@@ -105,55 +161,120 @@ class AgentConfig:
 
     def is_path_allowed(self, path: str) -> bool:
         """Check if a path is allowed for operations."""
-        path = os.path.abspath(path)
+        permissions = self.permissions
+        path = _abspath(path)
 
-        # Check denied paths first (higher priority)
-        for denied in self.permissions.denied_paths:
-            if path.startswith(os.path.abspath(denied)):
-                return False
+        # Denied paths take priority; startswith() tries every prefix in one C call
+        if path.startswith(permissions.denied_paths):
+            return False
+        return path.startswith(permissions.allowed_paths)
 
-        # Check allowed paths
-        for allowed in self.permissions.allowed_paths:
-            if path.startswith(os.path.abspath(allowed)):
-                return True
 
-        return False
+def _deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Deep merge override into base, in place.
 
+    Nested dicts present in both are merged; any other override value
+    replaces the base value.
 
-def _deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
-    """Deep merge two dictionaries."""
-    result = base.copy()
-    for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = _deep_merge(result[key], value)
-        else:
-            result[key] = value
-    return result
+    Args:
+        base: Dictionary to merge into; modified and returned
+        override: Values to merge on top
+
+    Returns:
+        base
+    """
+    stack = [(base, override)]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            current = target.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                stack.append((current, value))
+            else:
+                target[key] = value
+    return base
+
+
+def _intern(value: Any) -> Any:
+    """Intern a string from a small fixed vocabulary; other values pass through."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _has_yaml_content(data: bytes) -> bool:
+    """Check whether a YAML file has anything besides blank and comment lines."""
+    return any(
+        line and not line.startswith(b'#')
+        for line in (raw.strip() for raw in data.splitlines())
+    )
+
+
+def _file_signature(path: Any) -> Optional[Tuple[int, int]]:
+    """Get (mtime in ns, size) of a file, or None if it cannot be stat'ed."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _api_key_signature(api_cfg: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Get a value that changes whenever the configured API key source changes."""
+    source = api_cfg['api_key_source']
+    if source == 'env':
+        env_var = api_cfg['api_key_env']
+        return source, env_var, os.environ.get(env_var)
+    if source == 'file':
+        key_file = api_cfg['api_key_file']
+        return source, key_file, _file_signature(key_file)
+    return (source,)
+
+
+# Keys read from each merged config section, in constructor order
+_API_FIELDS = itemgetter('endpoint', 'poll_interval', 'timeout', 'verify_ssl')
+_PERMISSIONS_FIELDS = itemgetter('level', 'allowed_paths', 'denied_paths')
+_LOGGING_FIELDS = itemgetter('level', 'file', 'max_size_mb', 'backup_count')
+_AGENT_FIELDS = itemgetter('name', 'version')
+
+
+# Config path -> (config file signature, API settings, API key signature, config)
+_config_cache: Dict[str, Tuple[Optional[Tuple[int, int]], Dict[str, Any], Tuple[Any, ...], AgentConfig]] = {}
+
+
+# API key file path -> (mtime in ns, inode, key)
+_api_key_cache: Dict[str, Tuple[int, int, str]] = {}
 
 
 def _load_api_key(config: Dict[str, Any]) -> str:
     """Load API key from configured source."""
-    api_config = config.get('api', {})
-    source = api_config.get('api_key_source', 'file')
+    api_config = config['api']
+    source = api_config['api_key_source']
 
     if source == 'env':
-        env_var = api_config.get('api_key_env', 'HEXASCAN_API_KEY')
+        env_var = api_config['api_key_env']
         api_key = os.environ.get(env_var)
         if not api_key:
             raise ValueError(f"API key environment variable '{env_var}' not set")
         return api_key.strip()
 
     elif source == 'file':
-        key_file = api_config.get('api_key_file', '/etc/hexascan-agent/api_key')
-        key_path = Path(key_file)
+        key_file = api_config['api_key_file']
+
+        try:
+            st = os.stat(key_file)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"API key file not found: {key_file}") from None
 
-        if not key_path.exists():
-            raise FileNotFoundError(f"API key file not found: {key_file}")
+        # Reuse the key read last time unless the file was modified or replaced
+        cached = _api_key_cache.get(key_file)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_ino):
+            return cached[2]
 
-        api_key = key_path.read_text().strip()
+        api_key = Path(key_file).read_text().strip()
         if not api_key:
             raise ValueError(f"API key file is empty: {key_file}")
 
+        _api_key_cache[key_file] = (st.st_mtime_ns, st.st_ino, api_key)
         return api_key
 
     else:
@@ -164,6 +285,9 @@ def load_config(config_path: str = "/etc/hexascan-agent/agent.yaml") -> AgentCon
     """
     Load and validate agent configuration.
 
+    The result is cached per path and reused until the config file or the
+    API key source changes; load_config.cache_clear() empties the cache.
+
     Args:
         config_path: Path to the YAML configuration file
 
@@ -176,86 +300,175 @@ def load_config(config_path: str = "/etc/hexascan-agent/agent.yaml") -> AgentCon
     """
     path = Path(config_path)
 
-    # Start with defaults
-    config = DEFAULT_CONFIG.copy()
+    # Reuse the previous result if neither the file nor the API key changed
+    config_signature = _file_signature(path)
+    cached = _config_cache.get(config_path)
+    if (
+        cached is not None
+        and cached[0] == config_signature
+        and cached[2] == _api_key_signature(cached[1])
+    ):
+        return cached[3]
+
+    # The defaults are only read from here on, so they are used as is unless
+    # a custom config has to be merged into a private copy
+    config = DEFAULT_CONFIG
 
     # Load and merge custom config if exists
     if path.exists():
         logger.info(f"Loading configuration from {config_path}")
-        with open(path, 'r') as f:
-            custom_config = yaml.safe_load(f) or {}
-        config = _deep_merge(config, custom_config)
+        # Raw bytes in one read: libyaml detects and decodes the encoding itself
+        # and scans the buffer without calling back into Python for more input
+        data = path.read_bytes()
+        if _has_yaml_content(data):
+            custom_config = yaml.load(data, Loader=_SafeLoader) or {}
+            config = _deep_merge(copy.deepcopy(dict(DEFAULT_CONFIG)), custom_config)
     else:
         logger.warning(f"Config file not found at {config_path}, using defaults")
 
     # Load API key
+    api_cfg = config['api']
+    api_key_signature = _api_key_signature(api_cfg)
     try:
         api_key = _load_api_key(config)
     except (FileNotFoundError, ValueError) as e:
         logger.error(f"Failed to load API key: {e}")
         raise
 
-    # Build configuration objects
-    api_cfg = config.get('api', {})
+    # Build configuration objects; every key is present after merging the defaults
+    endpoint, poll_interval, timeout, verify_ssl = _API_FIELDS(api_cfg)
     api_config = ApiConfig(
-        endpoint=api_cfg.get('endpoint', DEFAULT_CONFIG['api']['endpoint']),
+        endpoint=endpoint,
         api_key=api_key,
-        poll_interval=api_cfg.get('poll_interval', 60),
-        timeout=api_cfg.get('timeout', 30),
-        verify_ssl=api_cfg.get('verify_ssl', True),
+        poll_interval=poll_interval,
+        timeout=timeout,
+        verify_ssl=verify_ssl,
     )
 
-    perm_cfg = config.get('permissions', {})
+    permission_level, allowed_paths, denied_paths = _PERMISSIONS_FIELDS(config['permissions'])
     permissions_config = PermissionsConfig(
-        level=perm_cfg.get('level', 'read_only'),
-        allowed_paths=perm_cfg.get('allowed_paths', []),
-        denied_paths=perm_cfg.get('denied_paths', []),
+        level=_intern(permission_level),
+        allowed_paths=tuple(sys.intern(_abspath(p)) for p in allowed_paths),
+        denied_paths=tuple(sys.intern(_abspath(p)) for p in denied_paths),
     )
 
-    checks_cfg = config.get('checks', {}).get('system', {})
+    # Thresholds are built when first read
+    system_checks_config = SystemChecksConfig(config['checks']['system'])
 
-    disk_cfg = checks_cfg.get('disk', {})
-    disk_thresholds = CheckThresholds(
-        enabled=disk_cfg.get('enabled', True),
-        warning_threshold=disk_cfg.get('warning_threshold', 80),
-        critical_threshold=disk_cfg.get('critical_threshold', 90),
-    )
-
-    cpu_cfg = checks_cfg.get('cpu', {})
-    cpu_thresholds = CheckThresholds(
-        enabled=cpu_cfg.get('enabled', True),
-        warning_threshold=cpu_cfg.get('warning_threshold', 80),
-        critical_threshold=cpu_cfg.get('critical_threshold', 95),
-    )
-
-    memory_cfg = checks_cfg.get('memory', {})
-    memory_thresholds = CheckThresholds(
-        enabled=memory_cfg.get('enabled', True),
-        warning_threshold=memory_cfg.get('warning_threshold', 85),
-        critical_threshold=memory_cfg.get('critical_threshold', 95),
-    )
-
-    system_checks_config = SystemChecksConfig(
-        disk=disk_thresholds,
-        cpu=cpu_thresholds,
-        memory=memory_thresholds,
-    )
-
-    log_cfg = config.get('logging', {})
+    log_level, log_file, max_size_mb, backup_count = _LOGGING_FIELDS(config['logging'])
     logging_config = LoggingConfig(
-        level=log_cfg.get('level', 'INFO'),
-        file=log_cfg.get('file'),
-        max_size_mb=log_cfg.get('max_size_mb', 10),
-        backup_count=log_cfg.get('backup_count', 5),
+        level=_intern(log_level),
+        file=log_file,
+        max_size_mb=max_size_mb,
+        backup_count=backup_count,
     )
 
-    agent_cfg = config.get('agent', {})
-
-    return AgentConfig(
-        name=agent_cfg.get('name', 'hexascan-agent'),
-        version=agent_cfg.get('version', '1.0.0'),
+    name, version = _AGENT_FIELDS(config['agent'])
+    agent_config = AgentConfig(
+        name=name,
+        version=version,
         api=api_config,
         permissions=permissions_config,
         system_checks=system_checks_config,
         logging=logging_config,
     )
+    _config_cache[config_path] = (config_signature, api_cfg, api_key_signature, agent_config)
+    return agent_config
+
+
+load_config.cache_clear = _config_cache.clear
+
+
+def _skip_node(loader: Any, event: Any) -> None:
+    """Consume the rest of the node that starts with event."""
+    depth = isinstance(event, yaml.CollectionStartEvent)
+    while depth:
+        event = loader.get_event()
+        if isinstance(event, yaml.CollectionStartEvent):
+            depth += 1
+        elif isinstance(event, yaml.CollectionEndEvent):
+            depth -= 1
+
+
+def _construct_scalar(loader: Any, event: Any) -> Any:
+    """Build the value of a scalar event the way the full loader would."""
+    tag = event.tag
+    if tag is None or tag == '!':
+        tag = loader.resolve(yaml.ScalarNode, event.value, event.implicit)
+    return loader.construct_object(yaml.ScalarNode(tag, event.value, style=event.style))
+
+
+def _read_agent_section(data: bytes) -> Dict[str, Any]:
+    """
+    Read the scalar values of the top-level agent mapping.
+
+    Walks the parser's event stream and stops at the end of the agent
+    section, so anything after it is never parsed.
+
+    Args:
+        data: Raw YAML document
+
+    Returns:
+        Scalar values of the agent section, empty if there is none
+    """
+    loader = _SafeLoader(data)
+    try:
+        loader.get_event()  # StreamStart
+        if not loader.check_event(yaml.DocumentStartEvent):
+            return {}
+        loader.get_event()
+        if not loader.check_event(yaml.MappingStartEvent):
+            return {}
+        loader.get_event()
+
+        while not loader.check_event(yaml.MappingEndEvent):
+            key = loader.get_event()
+            if (
+                isinstance(key, yaml.ScalarEvent)
+                and key.value == 'agent'
+                and loader.check_event(yaml.MappingStartEvent)
+            ):
+                break
+            _skip_node(loader, key)
+            _skip_node(loader, loader.get_event())
+        else:
+            return {}
+
+        loader.get_event()
+        section = {}
+        while not loader.check_event(yaml.MappingEndEvent):
+            key, value = loader.get_event(), loader.get_event()
+            if isinstance(key, yaml.ScalarEvent) and isinstance(value, yaml.ScalarEvent):
+                section[key.value] = _construct_scalar(loader, value)
+            else:
+                _skip_node(loader, key)
+                _skip_node(loader, value)
+        return section
+    finally:
+        loader.dispose()
+
+
+def load_config_header(config_path: str = "/etc/hexascan-agent/agent.yaml") -> Tuple[str, str]:
+    """
+    Read only the agent name and version from a config file.
+
+    Cheaper than load_config for quick identification or version gating:
+    parsing stops after the agent section, and no API key is needed.
+
+    Args:
+        config_path: Path to the YAML configuration file
+
+    Returns:
+        Tuple of (name, version), with defaults for missing values
+
+    Raises:
+        yaml.YAMLError: If the file is not valid YAML up to the agent section
+    """
+    agent_cfg = dict(DEFAULT_CONFIG['agent'])
+    try:
+        data = Path(config_path).read_bytes()
+    except FileNotFoundError:
+        data = b''
+    if _has_yaml_content(data):
+        agent_cfg.update(_read_agent_section(data))
+    return agent_cfg['name'], agent_cfg['version']